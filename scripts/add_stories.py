@@ -19,40 +19,229 @@ CSV Format (from Google Sheet):
 
 import argparse
 import csv
-import imghdr
+import hashlib
+import json
+import os
 import re
 import shutil
-import ssl
 import sys
-import urllib.request
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # Project root (parent of the scripts/ directory this file lives in)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+# Scratch space for the downloaded sheet and, under cover_etags/, the covers'
+# ETags (both kept between runs for conditional GETs), and, under covers/,
+# images downloaded during a run
+TEMP_DIR = Path.home() / '.eethal_temp'
+
 # Default Google Sheets URL
 DEFAULT_GOOGLE_SHEET_URL = "https://docs.google.com/spreadsheets/d/1zNhXLL_De8qCsk8OlORGQ_0tIk9Bw3aKi72HlSTEAOU/edit?usp=sharing"
 
-# CSV column name mapping
-CSV_COLUMNS = {
-    'english_title': 'English Title',
-    'tamil_title': 'Tamil Title',
-    'english_pdf': 'English PDF',
-    'tamil_pdf': 'Tamil PDF',
-    'image': 'Image',
-    'sw_link_eng': 'SW link-Eng',
-    'sw_link_tamil': 'SW link Tamil',
-    'translators': 'Translators',
-    'english_description': 'English Description',
-    'tamil_description': 'Tamil Description',
-    'status': 'Status',
-    'tags': 'Tags',
-}
+# CSV column names (spreadsheet header row)
+COL_ENGLISH_TITLE = 'English Title'
+COL_TAMIL_TITLE = 'Tamil Title'
+COL_PDF_ENG = 'English PDF'
+COL_PDF_TAM = 'Tamil PDF'
+COL_IMAGE = 'Image'
+COL_SW_LINK_ENG = 'SW link-Eng'
+COL_SW_LINK_TAM = 'SW link Tamil'
+COL_TRANSLATORS = 'Translators'
+COL_ENG_DESC = 'English Description'
+COL_TAM_DESC = 'Tamil Description'
+COL_STATUS = 'Status'
+COL_TAGS = 'Tags'
+
+# Columns that must be non-empty for a story to be created
+_REQUIRED_COLUMNS = (
+    COL_ENGLISH_TITLE, COL_TAMIL_TITLE, COL_PDF_ENG, COL_PDF_TAM,
+    COL_IMAGE, COL_TRANSLATORS, COL_ENG_DESC, COL_TAM_DESC,
+)
+
+
+class Columns(NamedTuple):
+    """Positions of the known columns in the sheet's header row (-1 if absent)."""
+    english_title: int
+    tamil_title: int
+    english_pdf: int
+    tamil_pdf: int
+    image: int
+    sw_link_eng: int
+    sw_link_tamil: int
+    translators: int
+    english_description: int
+    tamil_description: int
+    status: int
+    tags: int
+    required: tuple[int, ...]
+
+
+def resolve_columns(header: list[str]) -> Columns:
+    """
+    Look up the position of every known column once, from the header row.
+
+    Args:
+        header: First row of the CSV
+
+    Returns:
+        Columns index tuple for positional row access
+    """
+    positions = {}
+    for i, name in enumerate(header):
+        positions.setdefault(name, i)
+
+    def pos(name: str) -> int:
+        return positions.get(name, -1)
+
+    return Columns(
+        english_title=pos(COL_ENGLISH_TITLE),
+        tamil_title=pos(COL_TAMIL_TITLE),
+        english_pdf=pos(COL_PDF_ENG),
+        tamil_pdf=pos(COL_PDF_TAM),
+        image=pos(COL_IMAGE),
+        sw_link_eng=pos(COL_SW_LINK_ENG),
+        sw_link_tamil=pos(COL_SW_LINK_TAM),
+        translators=pos(COL_TRANSLATORS),
+        english_description=pos(COL_ENG_DESC),
+        tamil_description=pos(COL_TAM_DESC),
+        status=pos(COL_STATUS),
+        tags=pos(COL_TAGS),
+        required=tuple(pos(name) for name in _REQUIRED_COLUMNS),
+    )
+
 
+# Columns carried into a story, by Columns field name, and the required ones
+# (paired with their header names for error messages)
+_STORY_FIELDS = (
+    'english_title', 'tamil_title', 'english_pdf', 'tamil_pdf', 'image',
+    'sw_link_eng', 'sw_link_tamil', 'translators', 'english_description',
+    'tamil_description', 'tags',
+)
+_REQUIRED_FIELDS = tuple(zip(_REQUIRED_COLUMNS, (
+    'english_title', 'tamil_title', 'english_pdf', 'tamil_pdf', 'image',
+    'translators', 'english_description', 'tamil_description',
+)))
+
+
+def _get_col(row: list[str], idx: int) -> str:
+    """Safely get a stripped column value from a CSV row."""
+    return row[idx].strip() if 0 <= idx < len(row) else ""
+
+
+# Number of rows processed concurrently (image downloads are network-bound)
+MAX_WORKERS = 8
+
+# Number of stories whose tags are updated concurrently in --tags-only mode
+# (local file I/O only, so no rate limits apply)
+TAG_UPDATE_WORKERS = 16
+
+# Buffer size for streaming HTTP responses to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# (connect, read) timeouts in seconds for every HTTP request
+HTTP_TIMEOUT = (10, 60)
+
+# Shared HTTP session so connections to Google hosts are kept alive and
+# reused across rows instead of a new TCP + TLS handshake per download.
+# Transient gateway errors and dropped connections are retried with backoff.
+# Certificates are verified against requests' default bundle (certifi's, so
+# it works on Python installs missing system certs); requests >= 2.32 loads
+# it into one SSL context at import and reuses that for every connection.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(502, 503, 504), raise_on_status=False),
+))
+
+# Precompiled patterns (URLs, slugs, translator lists, --rows)
+_SHEET_ID_RE = re.compile(r'spreadsheets/d/([a-zA-Z0-9_-]+)')
+_GDRIVE_PATTERNS = (
+    re.compile(r'drive\.google\.com/file/d/([a-zA-Z0-9_-]+)'),
+    re.compile(r'drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)'),
+)
+# Literal prefixes of the same two URL shapes, with the characters that can
+# end the ID, for the regex-free fast path in _gdrive_id_fast
+_GDRIVE_MARKERS = (
+    ('drive.google.com/file/d/', ('/', '?')),
+    ('drive.google.com/open?id=', ('&',)),
+)
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+_SLUG_TRANS = str.maketrans({
+    c: '-' for c in map(chr, range(128)) if not ('a' <= c <= 'z' or '0' <= c <= '9')
+})
+_TRANSLATOR_SPLIT_RE = re.compile(r'[\r\n,]+')
+_ROWS_RE = re.compile(r'^(\d+)(?:-(\d+))?$')
+
+# Number of leading bytes inspected to detect the image type
+IMAGE_SNIFF_BYTES = 16
+
+# Cover file extensions probed in a story directory, most common first
+# (the sniffed types written by download_gdrive_image, plus hand-added .jpg)
+COVER_EXTENSIONS = ('png', 'jpeg', 'jpg', 'webp', 'gif')
+
+# ETags of downloaded covers, one file per story slug, so forced re-runs can
+# ask Drive whether the image changed (conditional GET). Kept out of
+# content/ so they never end up in the site or in git.
+COVER_ETAG_DIR = TEMP_DIR / 'cover_etags'
+
+# Version of _FRONTMATTER_TEMPLATE and how it is filled in. It is part of
+# every story's contentHash, so bump it whenever the generated front matter
+# changes, or existing stories will be skipped as unchanged.
+FRONTMATTER_VERSION = 3
+
+# Front matter line holding the hash of the inputs a story was generated from
+_CONTENT_HASH_RE = re.compile(r'^contentHash: "([0-9a-f]+)"$', re.MULTILINE)
+
+# Hugo front matter for a story, filled in by create_story_frontmatter
+_FRONTMATTER_TEMPLATE = '''---
+title: "{english_title}"
+date: {date}
+{content_hash_line}
+descriptions:
+  english: "{english_description}"
+  tamil: "{tamil_description}"
+
+pdfs:
+  tamil: "{tamil_pdf_preview}"
+  english: "{english_pdf_preview}"
 
+titles:
+  english: "{english_title}"
+  tamil: "{tamil_title}"
+
+translators:
+{translators_yaml}
+{original_block}{translation_block}{tags_block}
+coverImage: "{cover_image_filename}"
+draft: false
+---
+'''
+
+# Serialises console output from worker threads
+_print_lock = threading.Lock()
+
+
+def _print(*args, **kwargs) -> None:
+    """Thread-safe print used by functions that run inside worker threads."""
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+@lru_cache(maxsize=4096)
 def extract_google_sheet_id(url: str) -> Optional[str]:
     """
     Extract spreadsheet ID from Google Sheets URL.
@@ -63,8 +252,7 @@ def extract_google_sheet_id(url: str) -> Optional[str]:
     Returns:
         Spreadsheet ID if found, None otherwise
     """
-    pattern = r'spreadsheets/d/([a-zA-Z0-9_-]+)'
-    match = re.search(pattern, url)
+    match = _SHEET_ID_RE.search(url)
     if match:
         return match.group(1)
     return None
@@ -96,25 +284,65 @@ def download_google_sheet_as_csv(sheet_url: str, output_path: Path) -> None:
         f"https://docs.google.com/spreadsheets/d/e/{sheet_id}/pub?output=csv",
     ]
 
-    # Download CSV
+    # The previous download's metadata records which export URL worked (tried
+    # first, saving a round-trip per failing URL) and its validators, which
+    # let an unchanged sheet come back as a bodyless 304 and the CSV on disk
+    # be reused
+    meta_path = output_path.with_name(output_path.stem + '.meta.json')
+    try:
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        meta = {}
+    if not isinstance(meta, dict):
+        meta = {}
+    if meta.get('url') in export_urls:
+        export_urls.remove(meta['url'])
+        export_urls.insert(0, meta['url'])
+    have_csv = output_path.exists()
+
+    # Download CSV, streaming into a .part file that only replaces
+    # output_path once complete (a failed attempt never leaves a truncated CSV)
     print(f"Downloading spreadsheet as CSV...")
-    # Create SSL context
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-
+    part_path = output_path.with_name(output_path.name + '.part')
     last_error = None
     for export_url in export_urls:
+        headers = {}
+        if have_csv and meta.get('url') == export_url:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
         try:
-            with urllib.request.urlopen(export_url, context=ssl_context) as response:
-                with open(output_path, 'wb') as out_file:
-                    out_file.write(response.read())
+            with _SESSION.get(export_url, headers=headers, stream=True,
+                              timeout=HTTP_TIMEOUT) as response:
+                if response.status_code == 304:
+                    print(f"✓ Spreadsheet unchanged, using cached copy: {output_path}\n")
+                    return
+                response.raise_for_status()
+                validators = {
+                    'url': export_url,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                }
+                response.raw.decode_content = True
+                with open(part_path, 'wb') as out_file:
+                    shutil.copyfileobj(response.raw, out_file, DOWNLOAD_CHUNK_SIZE)
+            os.replace(part_path, output_path)
+            try:
+                meta_path.write_text(json.dumps(validators), encoding='utf-8')
+            except OSError:
+                pass  # Only an optimisation for the next run
             print(f"✓ Downloaded to: {output_path}\n")
             return  # Success!
         except Exception as e:
             last_error = e
             continue
 
+    try:
+        part_path.unlink()
+    except FileNotFoundError:
+        pass
+
     # All URLs failed
     raise Exception(
         f"Failed to download Google Sheet: {last_error}\n\n"
@@ -125,6 +353,7 @@ def download_google_sheet_as_csv(sheet_url: str, output_path: Path) -> None:
     )
 
 
+@lru_cache(maxsize=4096)
 def extract_gdrive_file_id(url: str) -> Optional[str]:
     """
     Extract file ID from Google Drive URL.
@@ -135,19 +364,102 @@ def extract_gdrive_file_id(url: str) -> Optional[str]:
     Returns:
         File ID if found, None otherwise
     """
-    patterns = [
-        r'drive\.google\.com/file/d/([a-zA-Z0-9_-]+)',
-        r'drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)',
-    ]
+    return _gdrive_id_fast(url) or _gdrive_id_regex(url)
+
 
-    for pattern in patterns:
-        match = re.search(pattern, url)
+def _gdrive_id_fast(url: str) -> Optional[str]:
+    """
+    Slice the file ID out of the usual Drive URL shapes with str.partition.
+
+    Returns None (so the caller falls back to the regexes) unless the slice
+    is exactly what _GDRIVE_PATTERNS would have captured.
+    """
+    for marker, terminators in _GDRIVE_MARKERS:
+        _, sep, rest = url.partition(marker)
+        if sep:
+            file_id = rest
+            for terminator in terminators:
+                file_id = file_id.partition(terminator)[0]
+            if file_id.isascii() and file_id.replace('-', '').replace('_', '').isalnum():
+                return file_id
+            return None
+    return None
+
+
+def _gdrive_id_regex(url: str) -> Optional[str]:
+    """Extract the file ID with the precompiled Drive URL patterns."""
+    for pattern in _GDRIVE_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
 
     return None
 
 
+def _sniff_image_type(head: bytes) -> Optional[str]:
+    """
+    Detect image type from the first bytes of a file.
+
+    Args:
+        head: Leading bytes of the file (at least IMAGE_SNIFF_BYTES)
+
+    Returns:
+        File extension ('png', 'jpeg', 'gif', 'webp') if recognised, None otherwise
+    """
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'jpeg'
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def _find_cached_cover(story_dir: Path) -> Optional[Path]:
+    """Return the existing cover image in a story directory, if any."""
+    if story_dir.is_dir():
+        for ext in COVER_EXTENSIONS:
+            cover_file = story_dir / f"cover.{ext}"
+            if cover_file.is_file():
+                return cover_file
+    return None
+
+
+def _index_cached_covers(stories_root: Path) -> dict[str, Path]:
+    """
+    Map every story slug to its existing cover image in one directory scan.
+
+    Built once per run so planning does not probe each story directory for
+    every cover extension; picks the same file _find_cached_cover would.
+
+    Args:
+        stories_root: The content/stories directory
+
+    Returns:
+        Dictionary of slug -> cover image path (stories without a cover are absent)
+    """
+    rank = {f"cover.{ext}": i for i, ext in enumerate(COVER_EXTENSIONS)}
+    index = {}
+    try:
+        with os.scandir(stories_root) as stories:
+            for story in stories:
+                if not story.is_dir():
+                    continue
+                best = None
+                with os.scandir(story.path) as entries:
+                    for entry in entries:
+                        if (entry.name in rank and entry.is_file()
+                                and (best is None or rank[entry.name] < rank[best.name])):
+                            best = entry
+                if best is not None:
+                    index[story.name] = Path(best.path)
+    except FileNotFoundError:
+        pass
+    return index
+
+
 def download_gdrive_image(gdrive_url: str, temp_dir: Path, slug: str, story_dir: Path, force: bool = False) -> Path:
     """
     Download cover image from Google Drive URL to local temp file (with caching).
@@ -166,10 +478,16 @@ def download_gdrive_image(gdrive_url: str, temp_dir: Path, slug: str, story_dir:
         Exception: If download fails or file ID extraction fails
     """
     # Check if story directory exists and has cover image (skip re-download)
-    if not force and story_dir.exists():
-        for cover_file in story_dir.glob('cover.*'):
-            print(f"  ✓ Using existing image: {cover_file.name}")
-            return cover_file
+    cover_file = _find_cached_cover(story_dir)
+    if cover_file and not force:
+        _print(f"  [{slug}] ✓ Using existing image: {cover_file.name}")
+        return cover_file
+
+    # With a cached cover and its ETag, let Drive answer 304 if unchanged
+    etag_file = COVER_ETAG_DIR / slug
+    headers = {}
+    if cover_file and etag_file.exists():
+        headers['If-None-Match'] = etag_file.read_text(encoding='utf-8').strip()
 
     # Extract file ID from Google Drive URL
     file_id = extract_gdrive_file_id(gdrive_url)
@@ -182,116 +500,150 @@ def download_gdrive_image(gdrive_url: str, temp_dir: Path, slug: str, story_dir:
     # Create temp directory if it doesn't exist
     temp_dir.mkdir(parents=True, exist_ok=True)
 
-    # Download to temp file
-    temp_file = temp_dir / f"{slug}_cover_temp"
-
+    final_file = None
     try:
-        print(f"  ⬇ Downloading image from Google Drive...")
-        # Create SSL context that doesn't verify certificates (needed for some systems)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-
-        # Download using urlopen with SSL context
-        with urllib.request.urlopen(download_url, context=ssl_context) as response:
-            with open(temp_file, 'wb') as out_file:
-                out_file.write(response.read())
+        _print(f"  [{slug}] ⬇ Downloading image from Google Drive...")
+        # Download through the shared session, detecting the image type
+        # from the first bytes of the response before writing anything
+        with _SESSION.get(download_url, headers=headers, stream=True,
+                          timeout=HTTP_TIMEOUT) as response:
+            if response.status_code == 304:
+                _print(f"  [{slug}] ✓ Image unchanged on Drive: {cover_file.name}")
+                return cover_file
+            response.raise_for_status()
+            etag = response.headers.get('ETag')
+            content_type = response.headers.get('Content-Type', '')
+            response.raw.decode_content = True
+            head = response.raw.read(IMAGE_SNIFF_BYTES)
+            img_type = _sniff_image_type(head)
+            if img_type:
+                # Type is known up front, so write straight to the final name
+                final_file = temp_dir / f"{slug}_cover.{img_type}"
+                with open(final_file, 'wb') as out_file:
+                    out_file.write(head)
+                    shutil.copyfileobj(response.raw, out_file, DOWNLOAD_CHUNK_SIZE)
     except Exception as e:
+        if final_file and final_file.exists():
+            final_file.unlink()
         raise Exception(f"Failed to download image: {e}")
 
-    # Detect image type and rename with correct extension
-    img_type = imghdr.what(temp_file)
     if not img_type:
-        temp_file.unlink()  # Clean up invalid file
+        # Drive answers with an HTML page (sign-in, virus-scan or quota
+        # notice) instead of the file when it can't serve it directly
+        if content_type.startswith('text/html') or head.lstrip()[:1] == b'<':
+            raise Exception(
+                "Downloaded file is not a valid image (Google Drive returned an HTML page; "
+                "check the image is shared with 'Anyone with the link')"
+            )
         raise Exception("Downloaded file is not a valid image")
 
-    # Rename with correct extension
-    final_file = temp_dir / f"{slug}_cover.{img_type}"
-    temp_file.rename(final_file)
-
-    print(f"  ✓ Downloaded image: {final_file.name}")
+    # Remember the ETag for the next forced run
+    try:
+        if etag:
+            COVER_ETAG_DIR.mkdir(parents=True, exist_ok=True)
+            etag_file.write_text(etag, encoding='utf-8')
+        elif etag_file.exists():
+            etag_file.unlink()
+    except OSError:
+        pass  # Only an optimisation for later runs
+
+    _print(f"  [{slug}] ✓ Downloaded image: {final_file.name}")
     return final_file
 
 
-def validate_csv_row(row: dict) -> tuple[bool, str]:
+def _row_fields(row: list[str], cols: Columns) -> dict[str, str]:
+    """
+    Strip the story fields of a CSV row once, keyed like Columns.
+
+    Args:
+        row: Row from csv.reader
+        cols: Column positions from resolve_columns()
+
+    Returns:
+        Dictionary of field name -> stripped value ("" if absent)
+    """
+    return {name: _get_col(row, getattr(cols, name)) for name in _STORY_FIELDS}
+
+
+def _missing_field(fields: dict[str, str]) -> str:
+    """Return the header of the first empty required field, or "" if none."""
+    for column, name in _REQUIRED_FIELDS:
+        if not fields[name]:
+            return column
+    return ""
+
+
+def validate_csv_row(row: list[str], cols: Columns) -> tuple[bool, str]:
     """
     Check if CSV row has all required fields.
 
     Args:
-        row: Dictionary from CSV DictReader
+        row: Row from csv.reader
+        cols: Column positions from resolve_columns()
 
     Returns:
         Tuple of (is_valid, error_message)
     """
-    required_fields = [
-        CSV_COLUMNS['english_title'],
-        CSV_COLUMNS['tamil_title'],
-        CSV_COLUMNS['english_pdf'],
-        CSV_COLUMNS['tamil_pdf'],
-        CSV_COLUMNS['image'],
-        CSV_COLUMNS['translators'],
-        CSV_COLUMNS['english_description'],
-        CSV_COLUMNS['tamil_description'],
-    ]
-
-    for field in required_fields:
-        if not row.get(field, '').strip():
+    for field, idx in zip(_REQUIRED_COLUMNS, cols.required):
+        if not _get_col(row, idx):
             return False, f"Missing required field: {field}"
 
     return True, ""
 
 
-def process_csv_row(row: dict, row_number: int, temp_dir: Path, force: bool = False) -> dict:
+def process_csv_row(row: list[str], cols: Columns, row_number: int, cover_image_path: Path,
+                    force: bool = False, slug: Optional[str] = None,
+                    today: Optional[str] = None,
+                    fields: Optional[dict[str, str]] = None) -> dict:
     """
-    Process a single CSV row.
+    Create the story for a single CSV row.
 
     Args:
-        row: Dictionary from CSV DictReader
+        row: Row from csv.reader
+        cols: Column positions from resolve_columns()
         row_number: Row number for reporting
-        temp_dir: Temporary directory for downloads
-        force: If True, re-download images even if cached
+        cover_image_path: Downloaded (temp) or cached (story dir) cover image
+        force: If True, rewrite the story even if unchanged
+        slug: Precomputed story slug (derived from the title if omitted)
+        today: ISO date for the front matter (current date if omitted)
+        fields: Row already stripped by _row_fields() and validated (the
+            row is validated and stripped here if omitted)
 
     Returns:
         Status dictionary with row, title, status, and optional error
     """
     try:
-        # Validate row
-        is_valid, error_msg = validate_csv_row(row)
-        if not is_valid:
-            return {
-                'row': row_number,
-                'title': row.get(CSV_COLUMNS['english_title'], 'Unknown'),
-                'status': 'failed',
-                'error': error_msg
-            }
+        if fields is None:
+            # Validate row
+            is_valid, error_msg = validate_csv_row(row, cols)
+            if not is_valid:
+                return {
+                    'row': row_number,
+                    'title': _get_col(row, cols.english_title) or 'Unknown',
+                    'status': 'failed',
+                    'error': error_msg
+                }
+            fields = _row_fields(row, cols)
 
         # Map CSV columns to story parameters
-        english_title = row[CSV_COLUMNS['english_title']].strip()
-        tamil_title = row[CSV_COLUMNS['tamil_title']].strip()
-        english_pdf = row[CSV_COLUMNS['english_pdf']].strip()
-        tamil_pdf = row[CSV_COLUMNS['tamil_pdf']].strip()
-        image_url = row[CSV_COLUMNS['image']].strip()
-        translators = row[CSV_COLUMNS['translators']].strip()
-        english_description = row[CSV_COLUMNS['english_description']].strip()
-        tamil_description = row[CSV_COLUMNS['tamil_description']].strip()
-        tags = row.get(CSV_COLUMNS['tags'], '').strip()
-        sw_link_eng = row.get(CSV_COLUMNS['sw_link_eng'], '').strip()
-        sw_link_tamil = row.get(CSV_COLUMNS['sw_link_tamil'], '').strip()
-
-        # Create slug and determine story directory
-        slug = create_slug(english_title)
+        english_title = fields['english_title']
+        tamil_title = fields['tamil_title']
+        english_pdf = fields['english_pdf']
+        tamil_pdf = fields['tamil_pdf']
+        translators = fields['translators']
+        english_description = fields['english_description']
+        tamil_description = fields['tamil_description']
+        tags = fields['tags']
+        sw_link_eng = fields['sw_link_eng']
+        sw_link_tamil = fields['sw_link_tamil']
+
+        # Determine story directory
+        slug = slug or create_slug(english_title)
         story_dir = PROJECT_ROOT / 'content' / 'stories' / slug
 
-        # Download cover image (with caching)
-        try:
-            cover_image_path = download_gdrive_image(image_url, temp_dir, slug, story_dir, force=force)
-        except Exception as e:
-            return {
-                'row': row_number,
-                'title': english_title,
-                'status': 'failed',
-                'error': f"Image download failed: {e}"
-            }
+        # A newly downloaded cover (not the cached one in story_dir) is a
+        # temp file, so it can be moved into place
+        downloaded = cover_image_path.parent != story_dir
 
         # Create story
         success = create_story(
@@ -306,11 +658,16 @@ def process_csv_row(row: dict, row_number: int, temp_dir: Path, force: bool = Fa
             tags=tags,
             sw_link_eng=sw_link_eng,
             sw_link_tamil=sw_link_tamil,
+            force=force,
+            slug=slug,
+            today=today,
+            move_cover=downloaded,
+            from_cache=not downloaded,
         )
 
         # Clean up: Delete downloaded temp image ONLY if it was newly downloaded
-        # (not from cache, i.e., not in story_dir)
-        if cover_image_path.parent == temp_dir and cover_image_path.exists():
+        # (not from cache, i.e., not in story_dir) and not already moved
+        if downloaded and cover_image_path.exists():
             cover_image_path.unlink()
 
         if success:
@@ -330,12 +687,149 @@ def process_csv_row(row: dict, row_number: int, temp_dir: Path, force: bool = Fa
     except Exception as e:
         return {
             'row': row_number,
-            'title': row.get(CSV_COLUMNS['english_title'], 'Unknown'),
+            'title': _get_col(row, cols.english_title) or 'Unknown',
             'status': 'failed',
             'error': str(e)
         }
 
 
+def _iter_rows_in_range(rows: Iterable[list[str]], row_start: int = 0,
+                        row_end: int = 0) -> Iterator[tuple[int, list[str]]]:
+    """
+    Yield (spreadsheet row number, row) for data rows within --rows.
+
+    Completely blank lines are skipped without being numbered, as
+    csv.DictReader did, and reading stops once row_end has been passed.
+
+    Args:
+        rows: Data rows from csv.reader (header already consumed)
+        row_start: First spreadsheet row to yield (0 = no filter)
+        row_end: Last spreadsheet row to yield (0 = no filter)
+    """
+    idx = 1  # row 1 is header
+    for row in rows:
+        if not row:
+            continue
+        idx += 1
+        if row_end and idx > row_end:
+            break
+        if row_start and idx < row_start:
+            continue
+        yield idx, row
+
+
+@dataclass
+class RowPlan:
+    """Work planned for one eligible spreadsheet row."""
+    idx: int
+    row: list[str]
+    slug: str
+    story_dir: Path
+    cached_cover: Optional[Path]
+    needs_download: bool
+    fields: dict[str, str]
+    error: str = ""
+
+
+def _plan_rows(rows: Iterable[list[str]], cols: Columns, row_start: int = 0, row_end: int = 0,
+               force: bool = False,
+               cover_index: Optional[dict[str, Path]] = None) -> tuple[list[RowPlan], int, int]:
+    """
+    Decide what to do with each CSV row before touching the network.
+
+    Rows outside the --rows range or marked 'done' are skipped, incomplete
+    rows are counted as invalid, and a row whose slug was already claimed
+    by an earlier row gets a plan carrying an error instead of silently
+    overwriting that story.
+
+    Args:
+        rows: Data rows from csv.reader (consumed lazily, one at a time)
+        cols: Column positions from resolve_columns()
+        row_start: First spreadsheet row to process (0 = no filter)
+        row_end: Last spreadsheet row to process (0 = no filter)
+        force: If True, ignore 'done' status and cached cover images
+        cover_index: Existing covers from _index_cached_covers() (story
+            directories are probed one by one if omitted)
+
+    Returns:
+        Tuple of (plans, skipped_count, invalid_count)
+    """
+    plans = []
+    skipped = invalid = 0
+    slug_rows = {}  # slug -> first row number that uses it
+
+    for idx, row in _iter_rows_in_range(rows, row_start, row_end):
+        # Skip rows with Status = 'done' (unless force is set)
+        status = _get_col(row, cols.status).lower()
+        if status == 'done' and not force:
+            skipped += 1
+            continue
+
+        # Skip empty / incomplete rows (fields are stripped once, here)
+        fields = _row_fields(row, cols)
+        if _missing_field(fields):
+            invalid += 1
+            continue
+
+        slug = create_slug(fields['english_title'])
+        story_dir = PROJECT_ROOT / 'content' / 'stories' / slug
+
+        if slug in slug_rows:
+            plans.append(RowPlan(idx, row, slug, story_dir, None, False, fields,
+                                 error=f"Duplicate slug '{slug}' (already used by row {slug_rows[slug]})"))
+            continue
+        slug_rows[slug] = idx
+
+        if force:
+            cached_cover = None
+        elif cover_index is not None:
+            cached_cover = cover_index.get(slug)
+        else:
+            cached_cover = _find_cached_cover(story_dir)
+        plans.append(RowPlan(idx, row, slug, story_dir, cached_cover, cached_cover is None, fields))
+
+    return plans, skipped, invalid
+
+
+def _fetch_cover(plan: RowPlan, image_url: str, temp_dir: Path, force: bool):
+    """
+    Download one plan's cover image (runs in a worker thread).
+
+    Returns:
+        Path to the downloaded image, or the Exception the download raised
+    """
+    try:
+        return download_gdrive_image(image_url, temp_dir / f"w{plan.idx}", plan.slug,
+                                     plan.story_dir, force=force)
+    except Exception as e:
+        return e
+
+
+def _create_planned_story(plan: RowPlan, cover, cols: Columns, force: bool, today: str) -> dict:
+    """
+    Create the story for one plan, given its cover download outcome.
+
+    Args:
+        plan: Planned row
+        cover: Cover image Path, or the Exception its download raised
+        cols: Column positions from resolve_columns()
+        force: If True, rewrite the story even if unchanged
+        today: ISO date shared by every story in the batch
+
+    Returns:
+        Status dictionary with row, title, status, and optional error
+    """
+    if plan.error or isinstance(cover, Exception):
+        return {
+            'row': plan.idx,
+            'title': plan.fields['english_title'],
+            'status': 'failed',
+            'error': plan.error or f"Image download failed: {cover}"
+        }
+    return process_csv_row(plan.row, cols, plan.idx, cover, force=force, slug=plan.slug,
+                           today=today, fields=plan.fields)
+
+
 def process_csv(csv_path: str, row_start: int = 0, row_end: int = 0, force: bool = False) -> dict:
     """
     Main CSV processing orchestrator.
@@ -351,63 +845,74 @@ def process_csv(csv_path: str, row_start: int = 0, row_end: int = 0, force: bool
     """
     print(f"Processing stories from CSV: {csv_path}\n")
 
-    # Read CSV file
+    # Existing covers are looked up from one scan of content/stories
+    cover_index = {} if force else _index_cached_covers(PROJECT_ROOT / 'content' / 'stories')
+
+    # Stream the CSV straight into the planner; only eligible rows are kept
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            cols = resolve_columns(header or [])
+            plans, skipped, invalid = _plan_rows(reader, cols, row_start, row_end, force,
+                                                 cover_index)
+            lines_read = reader.line_num
     except Exception as e:
         print(f"Error reading CSV file: {e}")
         return {'total': 0, 'successful': 0, 'failed': 0, 'details': []}
 
-    if not rows:
+    if lines_read <= 1:
         print("No rows found in CSV file (or only header row)")
         return {'total': 0, 'successful': 0, 'failed': 0, 'details': []}
 
     # Create temp directory
-    temp_dir = Path.home() / '.eethal_temp'
+    temp_dir = TEMP_DIR / 'covers'
 
-    # Build list of (row_number, row_dict) tuples, filtering by --rows if set
-    eligible = []
-    for idx, row in enumerate(rows, start=2):  # row 1 is header
-        if row_start and idx < row_start:
-            continue
-        if row_end and idx > row_end:
-            continue
-
-        # Skip rows with Status = 'done' (unless force is set)
-        status = row.get(CSV_COLUMNS['status'], '').strip().lower()
-        if status == 'done' and not force:
-            continue
-
-        # Skip empty rows
-        is_valid, _ = validate_csv_row(row)
-        if not is_valid:
-            continue
-
-        eligible.append((idx, row))
-
-    if not eligible:
+    if not plans:
         range_desc = f" in rows {row_start}-{row_end}" if row_start else ""
         print(f"No eligible stories found{range_desc}.")
         return {'total': 0, 'successful': 0, 'failed': 0, 'details': []}
 
+    new_count = sum(1 for p in plans if p.needs_download)
+    cached_count = sum(1 for p in plans if p.cached_cover)
+    duplicates = sum(1 for p in plans if p.error)
+    dup_desc = f", {duplicates} duplicate" if duplicates else ""
     if row_start:
-        print(f"Processing spreadsheet rows {row_start}-{row_end} ({len(eligible)} eligible stories)\n")
+        print(f"Processing spreadsheet rows {row_start}-{row_end}")
+    print(f"Plan: {new_count} new, {cached_count} cached, {skipped} skipped, {invalid} invalid{dup_desc}\n")
+
+    # Download missing covers on a thread pool (each into its own temp
+    # sub-directory so file names never clash) while stories are created
+    # on this thread. Rows are still created in order: each one only waits
+    # for its own cover, so earlier stories are written while later
+    # downloads are still in flight.
+    downloads = [p for p in plans if p.needs_download]
+    if downloads:
+        print(f"Downloading {len(downloads)} cover image(s)...\n")
 
-    # Process each row
     results = []
-    for i, (idx, row) in enumerate(eligible, 1):
-        english_title = row.get(CSV_COLUMNS['english_title'], 'Unknown').strip()
-        print(f"[{i}/{len(eligible)}] Row {idx}: Creating: {english_title}")
+    today = date.today().isoformat()  # one date for the whole batch
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as fetcher:
+        fetches = {
+            p.idx: fetcher.submit(_fetch_cover, p, p.fields['image'], temp_dir, force)
+            for p in downloads
+        }
 
-        result = process_csv_row(row, idx, temp_dir, force=force)
-        results.append(result)
+        def cover_for(plan: RowPlan):
+            fetch = fetches.get(plan.idx)
+            return fetch.result() if fetch else plan.cached_cover
 
-        if result['status'] == 'success':
-            print(f"  ✓ SUCCESS\n")
-        else:
-            print(f"  ✗ FAILED: {result.get('error', 'Unknown error')}\n")
+        for i, plan in enumerate(plans, 1):
+            english_title = plan.fields['english_title']
+            _print(f"[{i}/{len(plans)}] Row {plan.idx}: Creating: {english_title}")
+
+            result = _create_planned_story(plan, cover_for(plan), cols, force, today)
+            results.append(result)
+
+            if result['status'] == 'success':
+                _print(f"  ✓ SUCCESS\n")
+            else:
+                _print(f"  ✗ FAILED: {result.get('error', 'Unknown error')}\n")
 
     # Clean up temp directory
     try:
@@ -442,6 +947,7 @@ def process_csv(csv_path: str, row_start: int = 0, row_end: int = 0, force: bool
     }
 
 
+@lru_cache(maxsize=4096)
 def convert_gdrive_url_to_preview(url: str) -> str:
     """
     Convert Google Drive share URL to embed/preview format.
@@ -449,41 +955,61 @@ def convert_gdrive_url_to_preview(url: str) -> str:
     From: https://drive.google.com/file/d/FILE_ID/view?usp=sharing
     To: https://drive.google.com/file/d/FILE_ID/preview
     """
-    patterns = [
-        r'drive\.google\.com/file/d/([a-zA-Z0-9_-]+)',
-        r'drive\.google\.com/open\?id=([a-zA-Z0-9_-]+)',
-    ]
+    # Cheap literal checks first: non-Drive URLs are left alone and
+    # already-converted preview URLs need no regex work
+    if 'drive.google.com' not in url:
+        return url
+    if url.startswith('https://drive.google.com/file/d/') and url.endswith('/preview'):
+        return url
 
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            file_id = match.group(1)
-            return f"https://drive.google.com/file/d/{file_id}/preview"
+    file_id = extract_gdrive_file_id(url)
+    if file_id:
+        return f"https://drive.google.com/file/d/{file_id}/preview"
 
     return url
 
 
+@lru_cache(maxsize=1024)
 def create_slug(title: str) -> str:
     """Create URL-friendly slug from title."""
-    slug = title.lower()
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
-    slug = slug.strip('-')
-    return slug
+    lowered = title.lower()
+    if not lowered.isascii():
+        return _SLUG_RE.sub('-', lowered).strip('-')
 
+    # ASCII titles (the usual case): map every other character to '-' in
+    # one C-level pass, then collapse the runs the regex would have merged
+    slug = lowered.translate(_SLUG_TRANS)
+    while '--' in slug:
+        slug = slug.replace('--', '-')
+    return slug.strip('-')
 
+
+def _yaml_escape(value: str) -> str:
+    """Escape backslashes, double quotes and control characters for a YAML
+    double-quoted value (JSON string escapes are valid there), leaving the
+    text otherwise untouched. Used for URLs."""
+    return json.dumps(value, ensure_ascii=False)[1:-1]
+
+
+@lru_cache(maxsize=4096)
 def _yaml_safe(value: str) -> str:
     """Escape a string for use inside a YAML double-quoted value.
 
-    Replaces smart/curly quotes with single quotes, escapes any remaining
-    double quotes with a backslash, and strips HTML entities like &quot;.
+    Replaces smart/curly quotes and HTML entities like &quot; with single
+    quotes, then escapes backslashes, double quotes and control characters
+    (JSON string escapes are valid in YAML double-quoted scalars).
     """
     # Replace smart/curly double quotes with single quotes
     value = value.replace('\u201c', "'").replace('\u201d', "'")
     # Replace HTML-encoded quotes
     value = value.replace('&quot;', "'")
-    # Escape any remaining literal double quotes
-    value = value.replace('"', '\\"')
-    return value
+    # Escape backslashes, remaining double quotes and control characters
+    return _yaml_escape(value)
+
+
+def _yaml_list(items: Iterable[str]) -> str:
+    """Render strings as an indented YAML list of escaped double-quoted items."""
+    return '\n'.join([f'    - "{_yaml_safe(item)}"' for item in items])
 
 
 def create_story_frontmatter(
@@ -498,64 +1024,95 @@ def create_story_frontmatter(
     tags: str = "",
     sw_link_eng: str = "",
     sw_link_tamil: str = "",
+    content_hash: str = "",
+    today: Optional[str] = None,
 ) -> str:
-    """Generate Hugo front matter for the story."""
+    """Generate Hugo front matter for the story (dated today unless given)."""
 
-    # Sanitise text fields for YAML double-quoted strings
-    english_title = _yaml_safe(english_title)
-    tamil_title = _yaml_safe(tamil_title)
-    english_description = _yaml_safe(english_description)
-    tamil_description = _yaml_safe(tamil_description)
+    # Parse translators (handle both comma-separated and newline-separated)
+    names = (name.strip() for name in _TRANSLATOR_SPLIT_RE.split(translators))
+    translators_yaml = _yaml_list(name for name in names if name)
+
+    # Parse tags (comma-separated); the block is omitted when there are none
+    # rather than leaving an empty (null) tags: key
+    tag_list = _parse_tags(tags)
+    tags_block = f'\ntags:\n{_yaml_list(tag_list)}\n' if tag_list else ''
+
+    return _FRONTMATTER_TEMPLATE.format_map({
+        # Sanitise text fields for YAML double-quoted strings
+        'english_title': _yaml_safe(english_title),
+        'tamil_title': _yaml_safe(tamil_title),
+        'english_description': _yaml_safe(english_description),
+        'tamil_description': _yaml_safe(tamil_description),
+        'date': today or date.today().isoformat(),
+        'content_hash_line': f'contentHash: "{content_hash}"\n' if content_hash else '',
+        # Convert PDF URLs to preview format
+        'english_pdf_preview': _yaml_escape(convert_gdrive_url_to_preview(english_pdf)),
+        'tamil_pdf_preview': _yaml_escape(convert_gdrive_url_to_preview(tamil_pdf)),
+        'translators_yaml': translators_yaml,
+        'original_block': f'\noriginal:\n  url: "{_yaml_escape(sw_link_eng)}"\n' if sw_link_eng else '',
+        'translation_block': f'\ntranslation:\n  url: "{_yaml_escape(sw_link_tamil)}"\n' if sw_link_tamil else '',
+        'tags_block': tags_block,
+        'cover_image_filename': cover_image_filename,
+    })
+
+
+def _story_content_hash(*fields: str) -> str:
+    """Hash the inputs a story is generated from, to detect unchanged rows.
+
+    FRONTMATTER_VERSION is hashed in too, so a template change regenerates
+    every story.
+    """
+    joined = '\x1f'.join((f"v{FRONTMATTER_VERSION}",) + fields)
+    return hashlib.blake2b(joined.encode('utf-8'), digest_size=16).hexdigest()
 
-    # Convert PDF URLs to preview format
-    english_pdf_preview = convert_gdrive_url_to_preview(english_pdf)
-    tamil_pdf_preview = convert_gdrive_url_to_preview(tamil_pdf)
 
-    # Parse translators (handle both comma-separated and newline-separated)
-    # First split by newlines, then by commas
-    translator_list = []
-    for line in translators.split('\n'):
-        for name in line.split(','):
-            name = name.strip()
-            if name:
-                translator_list.append(name)
-    translators_yaml = '\n'.join([f'    - "{t}"' for t in translator_list])
-
-    # Parse tags (comma-separated)
-    tag_list = [t.strip() for t in tags.split(',') if t.strip()] if tags else []
-    tags_yaml = '\n'.join([f'    - "{t}"' for t in tag_list])
-
-    original_block = f'\noriginal:\n  url: "{sw_link_eng}"\n' if sw_link_eng else ''
-    translation_block = f'\ntranslation:\n  url: "{sw_link_tamil}"\n' if sw_link_tamil else ''
-
-    frontmatter = f'''---
-title: "{english_title}"
-date: {date.today().isoformat()}
+def _read_content_hash(index_md: Path) -> Optional[str]:
+    """Return the contentHash recorded in an existing index.md, if any."""
+    try:
+        with open(index_md, 'rb') as f:
+            head = f.read(1024).decode('utf-8', errors='ignore')
+    except OSError:
+        return None
+    match = _CONTENT_HASH_RE.search(head)
+    return match.group(1) if match else None
 
-descriptions:
-  english: "{english_description}"
-  tamil: "{tamil_description}"
 
-pdfs:
-  tamil: "{tamil_pdf_preview}"
-  english: "{english_pdf_preview}"
+def _write_if_changed(path: Path, text: str) -> bool:
+    """
+    Atomically write text to path, leaving the file untouched if identical.
 
-titles:
-  english: "{english_title}"
-  tamil: "{tamil_title}"
+    Keeping the mtime of unchanged files stops Hugo from re-rendering them,
+    and the temp-file + os.replace means a running `hugo server` never sees
+    a half-written file.
 
-translators:
-{translators_yaml}
-{original_block}{translation_block}
-tags:
-{tags_yaml}
+    Args:
+        path: File to write
+        text: New file contents
 
-coverImage: "{cover_image_filename}"
-draft: false
----
-'''
+    Returns:
+        True if the file was written, False if it already had this content
+    """
+    data = text.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
 
-    return frontmatter
+    # A dotfile, so Hugo never takes a temp file left by an interrupted
+    # run for a page resource
+    tmp = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f'.{path.name}.',
+                                      delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        os.chmod(tmp.name, 0o644)  # created 0600, unlike a plain open()
+        os.replace(tmp.name, path)
+    finally:
+        if os.path.exists(tmp.name):
+            os.unlink(tmp.name)
+    return True
 
 
 def create_story(
@@ -570,43 +1127,76 @@ def create_story(
     tags: str = "",
     sw_link_eng: str = "",
     sw_link_tamil: str = "",
+    force: bool = False,
+    slug: Optional[str] = None,
+    today: Optional[str] = None,
+    move_cover: bool = False,
+    from_cache: Optional[bool] = None,
 ) -> bool:
     """
     Create a new story directory with all necessary files.
 
+    Skips all file writes when the existing index.md was generated from the
+    same inputs (matching contentHash) and its cover image is in place,
+    unless force is set. slug defaults to one derived from english_title and
+    today (ISO date for new front matter) to the current date. With
+    move_cover, a temporary cover image is renamed into place rather than
+    copied. from_cache tells whether cover_image_path is already the story's
+    own cover; if not given, the two paths are resolved and compared.
+
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Create slug from English title
-        slug = create_slug(english_title)
+        # Create slug from English title unless the caller already has it
+        slug = slug or create_slug(english_title)
+        content_dir = PROJECT_ROOT / 'content' / 'stories' / slug
+        index_md = content_dir / 'index.md'
+
+        cover_image_path = Path(cover_image_path).expanduser()
+        cover_extension = cover_image_path.suffix
+        cover_filename = f"cover{cover_extension}"
+        cover_dest = content_dir / cover_filename
+
+        # Skip unchanged stories
+        content_hash = _story_content_hash(
+            english_title, tamil_title, english_description, tamil_description,
+            english_pdf, tamil_pdf, translators, cover_filename,
+            tags, sw_link_eng, sw_link_tamil,
+        )
+        if (not force and cover_dest.exists()
+                and _read_content_hash(index_md) == content_hash):
+            _print(f"  [{slug}] Skipped (unchanged)")
+            return True
 
         # Create story directory
-        content_dir = PROJECT_ROOT / 'content' / 'stories' / slug
         content_dir.mkdir(parents=True, exist_ok=True)
 
-        print(f"  Creating story: {slug}")
-        print(f"  Directory: {content_dir}")
+        _print(f"  [{slug}] Creating story in: {content_dir}")
 
         # Copy cover image
-        cover_image_path = Path(cover_image_path).expanduser()
-        if not cover_image_path.exists():
-            print(f"  Error: Cover image not found at {cover_image_path}")
+        if not cover_image_path.is_file():
+            _print(f"  [{slug}] Error: Cover image not found at {cover_image_path}")
             return False
 
-        cover_extension = cover_image_path.suffix
-        cover_filename = f"cover{cover_extension}"
-        cover_dest = content_dir / cover_filename
-
         # Only copy if source and destination are different
-        if cover_image_path.resolve() != cover_dest.resolve():
-            shutil.copy2(cover_image_path, cover_dest)
-            print(f"  Copied cover image: {cover_dest}")
+        if from_cache is None:
+            from_cache = cover_image_path.resolve() == cover_dest.resolve()
+        if not from_cache:
+            try:
+                if not move_cover:
+                    raise OSError
+                # Same filesystem: a single rename, no bytes copied
+                os.replace(cover_image_path, cover_dest)
+                _print(f"  [{slug}] Moved cover image: {cover_dest}")
+            except OSError:
+                # Other filesystem: copy (in-kernel where the OS supports it)
+                shutil.copy2(cover_image_path, cover_dest)
+                _print(f"  [{slug}] Copied cover image: {cover_dest}")
         else:
-            print(f"  Cover image already in place: {cover_filename}")
+            _print(f"  [{slug}] Cover image already in place: {cover_filename}")
 
         # Create index.md with front matter
-        index_md = content_dir / 'index.md'
         frontmatter = create_story_frontmatter(
             english_title,
             tamil_title,
@@ -619,15 +1209,19 @@ def create_story(
             tags=tags,
             sw_link_eng=sw_link_eng,
             sw_link_tamil=sw_link_tamil,
+            content_hash=content_hash,
+            today=today,
         )
 
-        index_md.write_text(frontmatter, encoding='utf-8')
-        print(f"  Created story file: {index_md}")
+        if _write_if_changed(index_md, frontmatter):
+            _print(f"  [{slug}] Created story file: {index_md}")
+        else:
+            _print(f"  [{slug}] Story file unchanged: {index_md}")
 
         return True
 
     except Exception as e:
-        print(f"  Error creating story: {e}")
+        _print(f"  Error creating story: {e}")
         return False
 
 
@@ -638,6 +1232,34 @@ def _parse_tags(tags_str: str) -> list[str]:
     return [t.strip() for t in tags_str.split(',') if t.strip()]
 
 
+def _skip_yaml_list(lines: list[str], start: int) -> int:
+    """
+    Skip the YAML list items that follow a "key:" line.
+
+    Items are '- value' lines, indented unless separated from the key by
+    blank lines; blank lines are only consumed when another item follows.
+
+    Args:
+        lines: Front matter lines
+        start: Index of the line after the key
+
+    Returns:
+        Index of the first line after the list
+    """
+    end = start
+    while True:
+        k = end
+        while k < len(lines) and not lines[k].strip():
+            k += 1
+        if k >= len(lines) - 1:  # the last line has no newline; never an item
+            return end
+        line = lines[k]
+        item = line.lstrip()
+        if not (len(item) > 2 and item.startswith('- ') and (k > end or item != line)):
+            return end
+        end = k + 1
+
+
 def update_story_tags(story_dir: Path, tag_list: list[str]) -> bool:
     """Update the tags in an existing story's index.md front matter.
 
@@ -656,98 +1278,122 @@ def update_story_tags(story_dir: Path, tag_list: list[str]) -> bool:
     # Front matter is between the first two '---' lines
     parts = content.split("---", 2)
     if len(parts) < 3:
-        print(f"  Could not parse front matter in {index_md}")
+        _print(f"  Could not parse front matter in {index_md}")
         return False
 
     front_matter = parts[1]
     body = parts[2]
 
-    # Remove existing tags block if present
-    # Match "tags:\n    - ...\n    - ...\n" (with possible variations in indentation)
-    front_matter = re.sub(
-        r'\ntags:\n(?:\s+- [^\n]+\n)*',
-        '\n',
-        front_matter,
-    )
+    # Remove existing tags block(s) if present: a "tags:" line and the
+    # "- ..." items under it, found with one linear line scan
+    lines = front_matter.split('\n')
+    kept = []
+    i = 0
+    while i < len(lines):
+        if 0 < i < len(lines) - 1 and lines[i] == 'tags:':
+            i = _skip_yaml_list(lines, i + 1)
+            continue
+        kept.append(lines[i])
+        i += 1
+    front_matter = '\n'.join(kept)
 
     # Build tags YAML block
-    tags_yaml = "\ntags:\n"
-    for tag in tag_list:
-        tags_yaml += f'    - "{tag}"\n'
+    # Insert tags at end of front matter (before closing ---) and
+    # reconstruct the file in a single join
+    new_content = ''.join([
+        "---", front_matter.rstrip('\n'), "\n\ntags:\n", _yaml_list(tag_list), "\n---", body,
+    ])
+    _write_if_changed(index_md, new_content)
+    return True
 
-    # Insert tags at end of front matter (before closing ---)
-    front_matter = front_matter.rstrip('\n') + '\n'
-    front_matter += tags_yaml
 
-    # Reconstruct the file
-    new_content = "---" + front_matter + "---" + body
-    index_md.write_text(new_content, encoding="utf-8")
-    return True
+def _update_row_tags(idx: int, row: list[str], cols: Columns) -> tuple[str, str]:
+    """
+    Update the tags of the story for one spreadsheet row (runs in a worker thread).
+
+    Args:
+        idx: Spreadsheet row number
+        row: Row from csv.reader
+        cols: Column positions from resolve_columns()
+
+    Returns:
+        Tuple of (outcome, message): outcome is 'updated', 'skipped' or
+        'no_tags', and message is the line to print (empty for none)
+    """
+    english_title = _get_col(row, cols.english_title)
+    if not english_title:
+        return 'skipped', ''
+
+    tags_str = _get_col(row, cols.tags)
+    tag_list = _parse_tags(tags_str)
+
+    if not tag_list:
+        return 'no_tags', f"  Row {idx}: {english_title} -- no tags, skipping."
+
+    slug = create_slug(english_title)
+    story_dir = PROJECT_ROOT / 'content' / 'stories' / slug
+
+    if not story_dir.exists():
+        return 'skipped', f"  Row {idx}: {english_title} -- story dir not found ({slug}/), skipping."
+
+    if update_story_tags(story_dir, tag_list):
+        return 'updated', f"  Row {idx}: {english_title} -- updated tags: {', '.join(tag_list)}"
+    return 'skipped', f"  Row {idx}: {english_title} -- failed to update tags."
 
 
 def process_tags_only(csv_path: str, row_start: int = 0, row_end: int = 0) -> dict:
     """Process only tags from the spreadsheet and update existing story files.
 
     Skips image download and story creation. Reads tags from the Tags column
-    and updates front matter of matching stories in content/stories/.
+    and updates front matter of matching stories in content/stories/. Each
+    story is independent local file I/O, so rows are handled on a thread
+    pool; messages are still printed in spreadsheet order.
 
     Returns summary dict with updated/skipped/no_tags counts.
     """
     print(f"Updating tags from CSV: {csv_path}\n")
 
+    counts = {'updated': 0, 'skipped': 0, 'no_tags': 0}
+
+    # Stream rows straight from the file; rows past --rows end are never read
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f, \
+                ThreadPoolExecutor(max_workers=TAG_UPDATE_WORKERS) as pool:
+            reader = csv.reader(f)
+            cols = resolve_columns(next(reader, None) or [])
+
+            futures = []
+            by_slug = {}  # slug -> latest future writing that story
+            for idx, row in _iter_rows_in_range(reader, row_start, row_end):
+                # Rows sharing a story are applied one after another, in
+                # order, so the last row still wins as before
+                slug = create_slug(_get_col(row, cols.english_title))
+                previous = by_slug.get(slug)
+                if previous:
+                    previous.result()
+                future = pool.submit(_update_row_tags, idx, row, cols)
+                by_slug[slug] = future
+                futures.append(future)
+
+            for future in futures:
+                outcome, message = future.result()
+                counts[outcome] += 1
+                if message:
+                    _print(message)
+
+            lines_read = reader.line_num
     except Exception as e:
         print(f"Error reading CSV file: {e}")
-        return {'updated': 0, 'skipped': 0, 'no_tags': 0}
+        return counts
 
-    if not rows:
+    if lines_read <= 1:
         print("No rows found in CSV file")
         return {'updated': 0, 'skipped': 0, 'no_tags': 0}
 
-    updated = 0
-    skipped = 0
-    no_tags = 0
-
-    for idx, row in enumerate(rows, start=2):  # row 1 is header
-        if row_start and idx < row_start:
-            continue
-        if row_end and idx > row_end:
-            continue
-
-        english_title = row.get(CSV_COLUMNS['english_title'], '').strip()
-        if not english_title:
-            skipped += 1
-            continue
-
-        tags_str = row.get(CSV_COLUMNS['tags'], '').strip()
-        tag_list = _parse_tags(tags_str)
-
-        if not tag_list:
-            print(f"  Row {idx}: {english_title} -- no tags, skipping.")
-            no_tags += 1
-            continue
-
-        slug = create_slug(english_title)
-        story_dir = PROJECT_ROOT / 'content' / 'stories' / slug
-
-        if not story_dir.exists():
-            print(f"  Row {idx}: {english_title} -- story dir not found ({slug}/), skipping.")
-            skipped += 1
-            continue
-
-        if update_story_tags(story_dir, tag_list):
-            print(f"  Row {idx}: {english_title} -- updated tags: {', '.join(tag_list)}")
-            updated += 1
-        else:
-            print(f"  Row {idx}: {english_title} -- failed to update tags.")
-            skipped += 1
-
     # Print summary
-    print(f"\nTags update complete: {updated} updated, {skipped} skipped, {no_tags} had no tags.")
-    return {'updated': updated, 'skipped': skipped, 'no_tags': no_tags}
+    print(f"\nTags update complete: {counts['updated']} updated, {counts['skipped']} skipped, "
+          f"{counts['no_tags']} had no tags.")
+    return counts
 
 
 def main():
@@ -831,7 +1477,7 @@ def main():
     row_start = 0
     row_end = 0
     if args.rows:
-        match = re.match(r'^(\d+)(?:-(\d+))?$', args.rows)
+        match = _ROWS_RE.match(args.rows)
         if not match:
             print(f"Error: invalid --rows format '{args.rows}'. Use e.g. '5-10' or '7'.",
                   file=sys.stderr)
@@ -846,7 +1492,7 @@ def main():
             sys.exit(1)
 
     # Always download from the default Google Sheet
-    temp_csv = Path.home() / '.eethal_temp' / 'downloaded_sheet.csv'
+    temp_csv = TEMP_DIR / 'downloaded_sheet.csv'
     temp_csv.parent.mkdir(parents=True, exist_ok=True)
 
     try:
@@ -858,20 +1504,11 @@ def main():
     # --tags-only mode: update tags in existing story front matter and exit
     if args.tags_only:
         process_tags_only(str(temp_csv), row_start=row_start, row_end=row_end)
-        try:
-            temp_csv.unlink()
-        except Exception:
-            pass
         sys.exit(0)
 
+    # The downloaded CSV is kept so the next run can revalidate it
     result = process_csv(str(temp_csv), row_start=row_start, row_end=row_end, force=args.force)
 
-    # Clean up temp CSV
-    try:
-        temp_csv.unlink()
-    except Exception:
-        pass
-
     # Print next steps
     print("\nNext steps:")
     print("1. Preview: hugo server -D")
@@ -14,10 +14,17 @@ Usage:
 """
 
 import argparse
+import os
 import shutil
 import sys
 from pathlib import Path
 
+# Stories live in content/stories relative to the project root (cwd)
+STORIES_DIR = Path('content/stories')
+
+# The title sits near the top of the front matter; stop looking after this
+TITLE_SCAN_LINES = 30
+
 
 def list_stories() -> list[str]:
     """
@@ -26,18 +33,45 @@ def list_stories() -> list[str]:
     Returns:
         List of story slugs
     """
-    stories_dir = Path('content/stories')
-    if not stories_dir.exists():
+    if not STORIES_DIR.exists():
         return []
 
-    stories = []
-    for item in stories_dir.iterdir():
-        if item.is_dir() and item.name != '.' and not item.name.startswith('_'):
-            stories.append(item.name)
+    # DirEntry.is_dir() uses the type from the directory listing, so no
+    # per-entry stat or Path object is needed
+    with os.scandir(STORIES_DIR) as entries:
+        stories = [
+            entry.name for entry in entries
+            if not entry.name.startswith('_') and entry.is_dir()
+        ]
 
     return sorted(stories)
 
 
+def read_story_title(slug: str) -> str:
+    """
+    Read a story's title from the front matter of its index.md.
+
+    Only the first few lines are read, not the whole file.
+
+    Args:
+        slug: Story slug (directory name)
+
+    Returns:
+        The title, or the slug if it cannot be found
+    """
+    try:
+        with open(STORIES_DIR / slug / 'index.md', 'r', encoding='utf-8') as f:
+            for i, line in enumerate(f):
+                key, sep, value = line.partition(':')
+                if sep and key == 'title':
+                    return value.strip().strip('"')
+                if i >= TITLE_SCAN_LINES or (i and line.rstrip() == '---'):
+                    break  # past the front matter
+    except (OSError, UnicodeDecodeError):
+        pass
+    return slug
+
+
 def delete_story(slug: str, force: bool = False) -> bool:
     """
     Delete a story by its slug.
@@ -49,10 +83,16 @@ def delete_story(slug: str, force: bool = False) -> bool:
     Returns:
         True if deleted, False otherwise
     """
-    story_dir = Path('content/stories') / slug
+    story_dir = STORIES_DIR / slug
+
+    # Check if story exists; listing it answers that and gives the file names
+    try:
+        with os.scandir(story_dir) as entries:
+            names = [entry.name for entry in entries]
+    except (FileNotFoundError, NotADirectoryError):
+        names = None
 
-    # Check if story exists
-    if not story_dir.exists():
+    if names is None:
         print(f"Error: Story '{slug}' not found")
         print(f"\nAvailable stories:")
         for s in list_stories():
@@ -60,12 +100,11 @@ def delete_story(slug: str, force: bool = False) -> bool:
         return False
 
     # Show what will be deleted
-    files = list(story_dir.glob('*'))
     print(f"Story to delete: {slug}")
     print(f"Location: {story_dir}")
     print(f"Files to be removed:")
-    for f in files:
-        print(f"  - {f.name}")
+    for name in names:
+        print(f"  - {name}")
 
     # Confirm deletion
     if not force:
@@ -128,22 +167,7 @@ def main():
 
         print(f"Available stories ({len(stories)}):")
         for story in stories:
-            story_dir = Path('content/stories') / story
-            index_md = story_dir / 'index.md'
-
-            # Try to read title from index.md
-            title = story
-            if index_md.exists():
-                try:
-                    content = index_md.read_text(encoding='utf-8')
-                    for line in content.split('\n'):
-                        if line.startswith('title:'):
-                            title = line.split('title:')[1].strip().strip('"')
-                            break
-                except Exception:
-                    pass
-
-            print(f"  - {story:30} ({title})")
+            print(f"  - {story:30} ({read_story_title(story)})")
 
         if not args.slug:
             print("\nUsage: python delete_stories.py <slug>")
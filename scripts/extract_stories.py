@@ -20,7 +20,6 @@ Usage:
 Requirements (install via: pip install -r requirements.txt):
     - requests
     - PyMuPDF
-    - gdown
     - certifi
     - google-api-python-client
     - google-auth-oauthlib
@@ -31,7 +30,8 @@ Requirements (install via: pip install -r requirements.txt):
 Setup for Gemini OCR (recommended for better Tamil text extraction):
     1. Get your API key from: https://aistudio.google.com/app/apikey
     2. Set environment variable: export GEMINI_API_KEY='your-key-here'
-    3. Note: Free tier has rate limits (5 requests/minute). The script automatically
+    3. Note: Free tier has rate limits (10 requests/minute for the default
+       gemini-2.5-flash, 5 for gemini-2.5-pro). The script automatically
        handles rate limiting with retries and delays between requests.
 
 Setup for Google Cloud Translation (recommended for Tamil descriptions):
@@ -57,19 +57,30 @@ Setup for Google Drive API (auto-makes files public before downloading):
 import argparse
 import certifi
 import csv
+import functools
+import gzip
+import hashlib
+import html
 import io
+import json
 import os
+import random
 import re
+import sqlite3
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 
 # Fix SSL certificates for Python installations missing system certs
 os.environ.setdefault("SSL_CERT_FILE", certifi.where())
 
 import fitz  # PyMuPDF — better Tamil font handling than pdfplumber
-import gdown
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import pytesseract
@@ -100,6 +111,7 @@ SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
 ]
 TOKEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "token.json")
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".stories_cache.sqlite")
 CREDENTIALS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "credentials.json")
 
 # Google Spreadsheet export URL (public CSV)
@@ -110,6 +122,83 @@ CSV_URL = (
     f"/export?format=csv&gid={SHEET_GID}"
 )
 
+# (connect, read) timeouts in seconds for every HTTP request
+HTTP_TIMEOUT = (10, 60)
+
+# Version of what's stored in the "pdf" cache table (see _cached_by_pdf);
+# bump it whenever the title/description parsing changes
+PDF_CACHE_VERSION = 2
+
+# Cover images stored in the PDF in one of these formats (extract_image()
+# extension -> file extension) are saved as-is instead of re-encoded as PNG
+COVER_PASSTHROUGH_EXTS = {"jpeg": "jpg", "jpg": "jpg", "png": "png"}
+
+# The Translation API (v2) takes at most 128 texts per request
+TRANSLATE_BATCH_SIZE = 128
+
+# Spreadsheet fields that must all be filled for --skip-if-complete to skip a row
+COMPLETE_ROW_FIELDS = ("english_title", "tamil_title", "english_description",
+                       "tamil_description", "image")
+
+# Buffer size for streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Drive API media downloads fetch the file in ranged requests of this size;
+# the client default (100 KB) costs dozens of round trips per story PDF
+DRIVE_MEDIA_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Without --jobs, the PDFs of up to this many upcoming stories are downloaded
+# in the background while the current story is being extracted
+PREFETCH_STORIES = 2
+
+# Shared HTTP session: connections to the Sheets and Drive hosts are kept
+# alive across stories instead of a new TCP + TLS handshake per request,
+# and throttling / transient server errors are retried with backoff
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=1,
+                      status_forcelist=(429, 500, 502, 503, 504)),
+))
+
+# Drive's download confirmation page: the form's action URL and body, and
+# the hidden inputs (id, export, confirm, uuid) to submit back
+_DRIVE_FORM_RE = re.compile(r'<form[^>]*id="download-form"[^>]*action="([^"]+)"[^>]*>(.*?)</form>', re.DOTALL)
+_DRIVE_HIDDEN_INPUT_RE = re.compile(r'<input[^>]*type="hidden"[^>]*name="([^"]+)"[^>]*value="([^"]*)"')
+
+# Precompiled patterns for Drive URLs, upload file names and --rows
+_DRIVE_ID_RE = re.compile(r"/d/([a-zA-Z0-9_-]+)")
+_SAFE_TITLE_RE = re.compile(r'[^\w\s-]')
+_ROWS_RE = re.compile(r'^(\d+)(?:-(\d+))?$')
+
+# Page 1 headers/logos to skip before the title (case-insensitive): the
+# EETHAL / Pratham Books / StoryWeaver logos, bare page numbers, Markdown
+# code fences and lines of only special characters, or anything starting
+# with a URL. One alternation, so each line costs a single match.
+_TITLE_SKIP_RE = re.compile(
+    r'^(?:(?:EETHAL|Pratham\s*Books?|StoryWeaver|\d+|```+|[*#-]+)$|www\.|http)',
+    re.IGNORECASE,
+)
+_TRANSLATOR_RE = re.compile(r"(?:Translator|Translated by)[:\s]+(.+)", re.IGNORECASE)
+
+# Bare reading-level lines ("Level 2", "நிலை 2")
+_LEVEL_ONLY_RE = re.compile(r'^Level\s+\d+\s*$', re.IGNORECASE)
+_TAMIL_LEVEL_ONLY_RE = re.compile(r'^நிலை\s*\d+\s*$')
+
+# Trailing metadata stripped from descriptions by _clean_description()
+_TRAILING_STORYWEAVER_RE = re.compile(r'\s*(?:story\s*weaver|storyweaver)\s*$', re.IGNORECASE)
+_TRAILING_URL_RE = re.compile(r'\s*(?:www\.|http)[^\s]*\s*$', re.IGNORECASE)
+_TRAILING_PUNCT_RE = re.compile(r'\s*[,\.\-]+\s*$')
+
+# Character classes for is_garbled_text(): control characters other than
+# tab/newline/carriage return; the UTF-8 prefixes of the Tamil block
+# (U+0B80-U+0BBF and U+0BC0-U+0BFF are E0 AE xx and E0 AF xx); and every
+# byte that isn't an ASCII letter, deleted to count the letters
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_TAMIL_UTF8_PREFIXES = (b"\xe0\xae", b"\xe0\xaf")
+_NON_ASCII_LETTER_BYTES = bytes(b for b in range(256) if not chr(b).isascii() or not chr(b).isalpha())
+
 # Column indices (0-based)
 COL_ENGLISH_TITLE = 0   # Column A
 COL_TAMIL_TITLE = 1     # Column B
@@ -143,9 +232,11 @@ examples:
   python extract_stories.py --rows 5-10         # process stories 5 through 10
   python extract_stories.py --rows 7            # process only story 7
   python extract_stories.py --ocr tesseract     # use Tesseract instead of Gemini
+  python extract_stories.py --gemini-model gemini-2.5-pro  # slower, most capable model
   python extract_stories.py --lang eng          # English descriptions only
   python extract_stories.py -o output.csv       # save results to a CSV file
   python extract_stories.py -q                  # suppress verbose logs
+  python extract_stories.py -j 4                # process 4 stories at a time
 """,
     )
     parser.add_argument(
@@ -159,40 +250,192 @@ examples:
     )
     parser.add_argument(
         "-o", "--output", metavar="FILE",
-        help="write results to a CSV file (default: console only)",
+        help="write results to a CSV file, gzip-compressed if FILE ends in .gz "
+             "(default: console only)",
     )
     parser.add_argument(
         "--lang", choices=["both", "eng", "tam"], default="both",
         help="which descriptions to fetch (default: both)",
     )
+    parser.add_argument(
+        "--skip-if-complete", action="store_true",
+        help="skip stories whose spreadsheet row already has both titles, "
+             "both descriptions and an image",
+    )
     parser.add_argument(
         "-q", "--quiet", action="store_true",
         help="suppress verbose progress logs (only show results)",
     )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, metavar="N",
+        help="process up to N stories concurrently (default: 1)",
+    )
     parser.add_argument(
         "--ocr", choices=["tesseract", "gemini"], default="gemini",
         help="OCR backend to use for Tamil text extraction (default: gemini). "
              "Gemini requires GEMINI_API_KEY environment variable.",
     )
+    parser.add_argument(
+        "--gemini-model", default=GEMINI_MODEL, metavar="MODEL",
+        help=f"Gemini model to use for OCR (default: {GEMINI_MODEL}; "
+             "e.g. gemini-2.5-pro for the hardest fonts)",
+    )
+    parser.add_argument(
+        "--gemini-rpm", type=float, metavar="N",
+        help="Gemini requests per minute to stay under (default: the model's "
+             "free-tier limit; raise it on a paid tier)",
+    )
+    parser.add_argument(
+        "--ocr-dpi", type=int, default=TESSERACT_OCR_DPI, metavar="DPI",
+        help=f"resolution to render pages at for Tesseract OCR "
+             f"(default: {TESSERACT_OCR_DPI}; try 300 for small print)",
+    )
     return parser.parse_args()
 
 
 QUIET = False
 OCR_BACKEND = "gemini"  # Set by command-line args
 
+# Serialises console output from concurrently processed stories (--jobs)
+_print_lock = threading.Lock()
+
+# Connection to the OCR/translation cache at CACHE_PATH (see _cache_db);
+# False once opening it has failed
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+# Per-thread Google API services for worker threads (see _thread_services)
+_thread_local = threading.local()
+
+# Content digests of files already hashed, by (path, size, mtime) (see _file_digest)
+_file_digests = {}
+
+# Drive file IDs known to be publicly viewable (see make_file_public)
+_public_files = set()
+
+# Gemini model shared by all OCR calls (see _get_gemini_model)
+_gemini_model = None
+_gemini_lock = threading.Lock()
+
+# PyMuPDF is not thread-safe, not even across separate documents, so every
+# call into fitz (including closing a document and freeing its pages and
+# pixmaps) is made holding this lock. With --jobs, downloads, OCR requests
+# and uploads still overlap; only the PDF parsing and rendering take turns.
+_fitz_lock = threading.Lock()
+
+
+def _print(*args, **kwargs):
+    """Thread-safe print, so lines from concurrent stories don't interleave.
+
+    Inside _buffered_output() the line goes to the thread's buffer instead.
+    """
+    buffer = getattr(_thread_local, "output", None)
+    if buffer is not None and "file" not in kwargs:
+        print(*args, file=buffer, **kwargs)
+        return
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+@contextmanager
+def _buffered_output():
+    """Hold back this thread's _print() output and print it in one piece.
+
+    Used per story with --jobs, so each story's log reads as one block
+    instead of being interleaved line by line with the others.
+    """
+    _thread_local.output = io.StringIO()
+    try:
+        yield
+    finally:
+        text = _thread_local.output.getvalue()
+        _thread_local.output = None
+        with _print_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+
+class RateLimiter:
+    """Spaces out calls to at most `rate` per second, shared across threads.
+
+    acquire() only waits when the previous call was less than 1/rate seconds
+    ago, so time already spent elsewhere (downloads, parsing) counts towards
+    the interval instead of being added to a fixed sleep.
+    """
+
+    def __init__(self, rate):
+        self.min_interval = 1.0 / rate
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next call slot, then claim it."""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_time)
+            self.next_time = slot + self.min_interval
+        # Sleep outside the lock; later callers have already been given later slots
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Gemini model used for OCR (--gemini-model), and the free-tier requests
+# per minute of the models we know; unknown models get the lowest rate
+GEMINI_MODEL = "gemini-2.5-flash"
+GEMINI_FREE_TIER_RPM = {"gemini-2.5-flash": 10, "gemini-2.5-pro": 5}
+GEMINI_DEFAULT_RPM = 5
+
+# Paces Gemini requests; main() sets the rate for the chosen model, or
+# --gemini-rpm's on a paid tier
+GEMINI_LIMITER = RateLimiter(GEMINI_FREE_TIER_RPM[GEMINI_MODEL] / 60)
+
+# Deterministic, single-candidate transcription. 2.5 models count their
+# "thinking" tokens against max_output_tokens, so the cap leaves room for
+# those on top of a page's worth of text.
+GEMINI_GENERATION_CONFIG = {"temperature": 0.0, "candidate_count": 1, "max_output_tokens": 4096}
+
+# Storybook pages are harmless; don't let safety filters return empty text
+GEMINI_SAFETY_SETTINGS = {
+    category: "BLOCK_NONE"
+    for category in ("harassment", "hate_speech", "sexually_explicit", "dangerous")
+}
+
+# Pages sent to Tesseract are rendered at this DPI (--ocr-dpi), in grayscale:
+# storybook text is large, and Tesseract binarizes the image anyway
+TESSERACT_OCR_DPI = 200
+
+# Pages sent to Gemini are rendered so the longer side is about this many
+# pixels (plenty for storybook text), within these DPI bounds
+GEMINI_OCR_LONG_SIDE = 1536
+GEMINI_OCR_MIN_DPI = 150
+GEMINI_OCR_MAX_DPI = 300
+
+# Server-suggested wait in a Gemini 429 error: RetryInfo as JSON
+# ("retryDelay": "59s") or protobuf text (retry_delay { seconds: 59 }),
+# or the "Please retry in 12.3s" message
+_RETRY_DELAY_RE = re.compile(
+    r'retry_?delay"?\s*[:={]\s*(?:seconds:\s*)?"?(\d+(?:\.\d+)?)|retry in (\d+(?:\.\d+)?)',
+    re.IGNORECASE,
+)
+# QuotaFailure violation for a per-day quota (quotaId / quota_id ...PerDay...)
+_DAILY_QUOTA_RE = re.compile(r'quota_?id"?\s*[:=]\s*"?[\w-]*PerDay', re.IGNORECASE)
+
+# Set once the daily Gemini quota is spent; later OCR calls return at once
+_gemini_quota_exhausted = threading.Event()
+
 
 def log(msg):
     """Print a timestamped log message (suppressed in quiet mode)."""
     if QUIET:
         return
     timestamp = time.strftime("%H:%M:%S")
-    print(f"[{timestamp}] {msg}", flush=True)
+    _print(f"[{timestamp}] {msg}", flush=True)
 
 
 def fetch_spreadsheet_csv():
     """Download the Google Sheet as CSV."""
     log("Fetching spreadsheet data from Google Sheets...")
-    response = requests.get(CSV_URL, allow_redirects=True)
+    response = SESSION.get(CSV_URL, allow_redirects=True, timeout=HTTP_TIMEOUT)
     response.raise_for_status()
     log(f"Spreadsheet fetched OK ({len(response.text)} bytes)")
     return response.text
@@ -203,8 +446,8 @@ def _get_col(row, idx):
     return row[idx].strip() if len(row) > idx else ""
 
 
-def parse_all_rows(csv_text):
-    """Parse CSV and return ALL data rows (for --make-public).
+def iter_all_rows(csv_text):
+    """Parse CSV and yield ALL non-empty data rows, one at a time.
 
     Each row includes a 'row_num' field with its spreadsheet row number
     (row 1 = header, row 2 = first data row).
@@ -212,13 +455,10 @@ def parse_all_rows(csv_text):
     reader = csv.reader(io.StringIO(csv_text))
     next(reader)  # skip header row (row 1)
 
-    rows = []
-    row_num = 1  # header is row 1
-    for row in reader:
-        row_num += 1
+    for row_num, row in enumerate(reader, start=2):
         if not any(cell.strip() for cell in row):
             continue  # skip completely empty rows
-        rows.append({
+        yield {
             "row_num": row_num,
             "english_title": _get_col(row, COL_ENGLISH_TITLE),
             "tamil_title": _get_col(row, COL_TAMIL_TITLE),
@@ -232,43 +472,185 @@ def parse_all_rows(csv_text):
             "tamil_description": _get_col(row, COL_TAM_DESC),
             "status": _get_col(row, COL_STATUS),
             "tags": _get_col(row, COL_TAGS),
-        })
-    return rows
+        }
 
 
 def parse_csv(csv_text):
     """Parse CSV and extract rows that have SW links filled out."""
-    all_rows = parse_all_rows(csv_text)
     return [
-        row for row in all_rows
+        row for row in iter_all_rows(csv_text)
         if row["sw_link_eng"] or row["sw_link_tam"]
     ]
 
 
+def _cache_db():
+    """Open (once) the on-disk cache of OCR and translation results,
+    of what was extracted from each PDF, and of Drive files known to be public.
+
+    Returns None if the cache file can't be opened; callers then just skip
+    caching. Every insert commits on its own, so an interrupted run keeps
+    everything it already paid for.
+    """
+    global _cache_conn
+    with _cache_lock:
+        if _cache_conn is None:
+            try:
+                conn = sqlite3.connect(CACHE_PATH, check_same_thread=False, isolation_level=None)
+                conn.execute("CREATE TABLE IF NOT EXISTS ocr (key TEXT PRIMARY KEY, text TEXT)")
+                conn.execute("CREATE TABLE IF NOT EXISTS tr (key TEXT PRIMARY KEY, text TEXT)")
+                conn.execute("CREATE TABLE IF NOT EXISTS pdf (key TEXT PRIMARY KEY, text TEXT)")
+                conn.execute("CREATE TABLE IF NOT EXISTS public (key TEXT PRIMARY KEY, text TEXT)")
+                _cache_conn = conn
+            except sqlite3.Error as e:
+                log(f"    Result cache unavailable ({e}), continuing without it.")
+                _cache_conn = False
+        return _cache_conn or None
+
+
+def _cache_get(table, key):
+    """Return the cached text for key in table ("ocr", "tr", "pdf" or "public"), or None."""
+    conn = _cache_db()
+    if conn is None:
+        return None
+    try:
+        with _cache_lock:
+            row = conn.execute(f"SELECT text FROM {table} WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def _cache_put(table, key, text):
+    """Store text under key in table ("ocr", "tr", "pdf" or "public"); failures are ignored."""
+    conn = _cache_db()
+    if conn is None:
+        return
+    try:
+        with _cache_lock:
+            conn.execute(f"INSERT OR REPLACE INTO {table} (key, text) VALUES (?, ?)", (key, text))
+    except sqlite3.Error:
+        pass
+
+
+def _file_digest(path):
+    """SHA-1 hex digest of a file's contents, read in DOWNLOAD_CHUNK_SIZE blocks.
+
+    Digests are remembered by path, size and modification time, so the
+    several cache lookups for one downloaded PDF read and hash it once.
+    """
+    stat = os.stat(path)
+    memo_key = (path, stat.st_size, stat.st_mtime_ns)
+    digest = _file_digests.get(memo_key)
+    if digest is None:
+        h = hashlib.sha1()
+        # Unbuffered: the blocks are already large, so skip the extra copy
+        with open(path, "rb", buffering=0) as f:
+            for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                h.update(block)
+        digest = _file_digests[memo_key] = h.hexdigest()
+    return digest
+
+
+def _cached_by_pdf(label, is_cacheable):
+    """Decorator caching a PDF extractor's result in the "pdf" cache table.
+
+    The extractor is called as func(doc, pdf_path, is_tamil=False) and its
+    result is stored as JSON under the PDF's content digest, so a re-run on
+    an unchanged PDF skips extraction (and any OCR) entirely. Results that
+    is_cacheable(result, is_tamil) rejects (errors, or Tamil text still
+    garbled because OCR failed) are not stored and are retried next run.
+    Bump PDF_CACHE_VERSION when the parsing changes.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(doc, pdf_path, is_tamil=False):
+            # Tamil results can come from OCR, so they also depend on the
+            # backend and its settings (Gemini model, Tesseract DPI)
+            if not is_tamil:
+                variant = "eng"
+            elif OCR_BACKEND == "gemini":
+                variant = f"tam-gemini-{GEMINI_MODEL}"
+            else:
+                variant = f"tam-{OCR_BACKEND}-{TESSERACT_OCR_DPI}dpi"
+            try:
+                cache_key = f"{_file_digest(pdf_path)}:{func.__name__}:{variant}:v{PDF_CACHE_VERSION}"
+            except OSError:
+                cache_key = None
+            cached = _cache_get("pdf", cache_key) if cache_key else None
+            if cached:
+                log(f"    ✓ {label} loaded from cache")
+                return json.loads(cached)
+
+            result = func(doc, pdf_path, is_tamil=is_tamil)
+            if cache_key and is_cacheable(result, is_tamil):
+                _cache_put("pdf", cache_key, json.dumps(result, ensure_ascii=False))
+            return result
+        return wrapper
+    return decorator
+
+
 def extract_drive_file_id(url):
     """Extract the Google Drive file ID from a Drive URL."""
-    match = re.search(r"/d/([a-zA-Z0-9_-]+)", url)
+    match = _DRIVE_ID_RE.search(url)
     return match.group(1) if match else None
 
 
-def extract_cover_image(pdf_path, output_path):
-    """Extract the largest image from page 1 of a PDF and save it as PNG.
+def open_pdf(pdf_path):
+    """Open a downloaded PDF with PyMuPDF.
+
+    The title, description, cover and OCR steps all take the open document,
+    so each PDF is parsed once per story; the caller closes it with
+    closing_pdf().
+    Returns None (after logging why) if the file can't be read as a PDF.
+    """
+    try:
+        with _fitz_lock:
+            return fitz.open(pdf_path)
+    except Exception as e:
+        log(f"    Error reading PDF: {e}")
+        return None
+
+
+@contextmanager
+def closing_pdf(doc):
+    """Close a document from open_pdf() at the end of the with block."""
+    try:
+        yield doc
+    finally:
+        with _fitz_lock:
+            doc.close()
+
+
+def _page_count(doc):
+    """Return the number of pages in an open PDF."""
+    with _fitz_lock:
+        return len(doc)
+
+
+def extract_cover_image(doc, output_base):
+    """Extract the largest image from page 1 of a PDF and save it.
 
     Selects the largest image by its rendered size on the page (not intrinsic
     pixel dimensions), so the cover illustration is chosen over high-res logos.
-    Handles CMYK-to-RGB conversion for compatibility.
+    A JPEG or PNG image in RGB or grayscale is written out as stored in the
+    PDF, without decoding and re-encoding it; anything else (e.g. CMYK) is
+    converted to RGB and saved as PNG.
+
+    The caller must hold _fitz_lock.
 
-    Returns True if an image was successfully extracted, False otherwise.
+    Args:
+        doc: Open PyMuPDF document of the PDF
+        output_base: Output path without extension; ".jpg" or ".png" is added
+
+    Returns the path of the saved image, or None if no image was extracted.
     """
     try:
-        doc = fitz.open(pdf_path)
         page = doc[0]
         images = page.get_images(full=True)
 
         if not images:
             log("    No images found on page 1.")
-            doc.close()
-            return False
+            return None
 
         # Use get_image_info to find rendered bounding boxes on the page.
         # This tells us the actual display size, not intrinsic pixel dimensions.
@@ -301,24 +683,29 @@ def extract_cover_image(pdf_path, output_path):
                     best_xref = xref
 
         if best_xref is None:
-            doc.close()
-            return False
+            return None
 
-        pix = fitz.Pixmap(doc, best_xref)
+        image = doc.extract_image(best_xref)
+        if image and image["ext"] in COVER_PASSTHROUGH_EXTS and image["colorspace"] <= 3:
+            output_path = f"{output_base}.{COVER_PASSTHROUGH_EXTS[image['ext']]}"
+            with open(output_path, "wb") as f:
+                f.write(image["image"])
+        else:
+            pix = fitz.Pixmap(doc, best_xref)
 
-        # Convert CMYK to RGB if needed
-        if pix.n - pix.alpha > 3:
-            pix = fitz.Pixmap(fitz.csRGB, pix)
+            # Convert CMYK to RGB if needed
+            if pix.n - pix.alpha > 3:
+                pix = fitz.Pixmap(fitz.csRGB, pix)
 
-        pix.save(output_path)
-        doc.close()
+            output_path = f"{output_base}.png"
+            pix.save(output_path)
 
         log(f"    Extracted cover image (rendered area {best_area:.0f}): {os.path.basename(output_path)}")
-        return True
+        return output_path
 
     except Exception as e:
         log(f"    Failed to extract cover image: {e}")
-        return False
+        return None
 
 
 def get_parent_folder_id(drive_service, file_id):
@@ -346,7 +733,8 @@ def upload_image_to_drive(drive_service, local_path, filename, folder_id):
             'name': filename,
             'parents': [folder_id],
         }
-        media = MediaFileUpload(local_path, mimetype='image/png', resumable=True)
+        mimetype = 'image/jpeg' if local_path.endswith('.jpg') else 'image/png'
+        media = MediaFileUpload(local_path, mimetype=mimetype, resumable=True)
         uploaded = drive_service.files().create(
             body=file_metadata, media_body=media, fields='id'
         ).execute()
@@ -380,7 +768,7 @@ def write_image_url_to_sheet(sheets_service, row_num, image_url):
         return False
 
 
-def process_cover_image(pdf_path, story, drive_service, sheets_service, tmpdir, idx):
+def process_cover_image(doc, story, drive_service, sheets_service, tmpdir, idx):
     """Extract cover image from PDF, upload to Drive, and update spreadsheet.
 
     Skips if column E already has a value or if Drive API is unavailable.
@@ -395,8 +783,9 @@ def process_cover_image(pdf_path, story, drive_service, sheets_service, tmpdir,
         return None
 
     # Step 1: Extract cover image from page 1
-    image_path = os.path.join(tmpdir, f"cover_{idx}.png")
-    if not extract_cover_image(pdf_path, image_path):
+    with _fitz_lock:
+        image_path = extract_cover_image(doc, os.path.join(tmpdir, f"cover_{idx}"))
+    if not image_path:
         return None
 
     # Step 2: Get parent folder of the English PDF
@@ -412,8 +801,8 @@ def process_cover_image(pdf_path, story, drive_service, sheets_service, tmpdir,
 
     # Step 3: Upload image to Drive
     title = story.get("english_title", f"story_{idx}")
-    safe_title = re.sub(r'[^\w\s-]', '', title).strip().replace(' ', '_')
-    upload_filename = f"{safe_title}_cover.png"
+    safe_title = _SAFE_TITLE_RE.sub('', title).strip().replace(' ', '_')
+    upload_filename = f"{safe_title}_cover{os.path.splitext(image_path)[1]}"
 
     uploaded_file_id = upload_image_to_drive(
         drive_service, image_path, upload_filename, folder_id
@@ -429,7 +818,7 @@ def process_cover_image(pdf_path, story, drive_service, sheets_service, tmpdir,
     if sheets_service:
         write_image_url_to_sheet(sheets_service, story["row_num"], image_drive_url)
 
-    print(f"  >> Cover image uploaded: {image_drive_url}")
+    _print(f"  >> Cover image uploaded: {image_drive_url}")
     return image_drive_url
 
 
@@ -473,62 +862,108 @@ def get_drive_service():
             f.write(creds.to_json())
         log("Token saved for future runs.")
 
-    return build("drive", "v3", credentials=creds), creds
+    return build("drive", "v3", credentials=creds, cache_discovery=False), creds
 
 
 def make_file_public(drive_service, drive_url):
-    """Ensure a single Drive file is publicly viewable. No-op if already public."""
+    """Ensure a single Drive file is publicly viewable. No-op if already public.
+
+    Files found or made public are remembered (in memory and in the result
+    cache), so later calls for them skip the permission requests.
+    """
     file_id = extract_drive_file_id(drive_url)
-    if not file_id:
+    if not file_id or file_id in _public_files:
+        return
+    if _cache_get("public", file_id):
+        _public_files.add(file_id)
         return
     try:
-        perms = drive_service.permissions().list(fileId=file_id).execute()
+        perms = drive_service.permissions().list(
+            fileId=file_id, fields="permissions(type)"
+        ).execute()
         already_public = any(
             p.get("type") == "anyone" for p in perms.get("permissions", [])
         )
-        if already_public:
-            return
-        drive_service.permissions().create(
-            fileId=file_id,
-            body={"type": "anyone", "role": "reader"},
-        ).execute()
-        log(f"    Made file {file_id} publicly viewable.")
+        if not already_public:
+            drive_service.permissions().create(
+                fileId=file_id,
+                body={"type": "anyone", "role": "reader"},
+            ).execute()
+            log(f"    Made file {file_id} publicly viewable.")
+        _public_files.add(file_id)
+        _cache_put("public", file_id, "anyone")
     except Exception as e:
         log(f"    Could not set public permissions for {file_id}: {e}")
 
 
+def _download_public_drive_file(file_id, dest_path):
+    """Download a publicly shared Drive file through the shared session.
+
+    Drive answers large (or unscannable) files with an HTML "can't scan for
+    viruses" page instead of the file; its download form (or, on older
+    pages, a download_warning cookie) carries the token to confirm with.
+    Raises an exception if no file could be fetched.
+    """
+    url = "https://drive.google.com/uc"
+    params = {"id": file_id, "export": "download"}
+    for _ in range(2):  # the original request, then at most one confirmation
+        with SESSION.get(url, params=params, stream=True, timeout=HTTP_TIMEOUT) as response:
+            response.raise_for_status()
+            if not response.headers.get("Content-Type", "").startswith("text/html"):
+                part_path = dest_path + ".part"
+                with open(part_path, "wb") as f:
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(part_path, dest_path)
+                return
+            page = response.text
+            cookies = response.cookies
+
+        form = _DRIVE_FORM_RE.search(page)
+        if form:
+            url = html.unescape(form.group(1))
+            params = {name: html.unescape(value)
+                      for name, value in _DRIVE_HIDDEN_INPUT_RE.findall(form.group(2))}
+        else:
+            token = next((v for k, v in cookies.items() if k.startswith("download_warning")), None)
+            if not token:
+                break
+            params = {**params, "confirm": token}
+
+    raise Exception("Google Drive returned an HTML page instead of the file "
+                    "(is it shared with 'Anyone with the link'?)")
+
+
 def download_pdf(drive_url, dest_path, drive_service=None):
-    """Download a PDF from Google Drive. Uses Drive API if available, else gdown."""
+    """Download a PDF from Google Drive. Uses Drive API if available, else a public download."""
     file_id = extract_drive_file_id(drive_url)
     if not file_id:
         log(f"    Could not extract file ID from: {drive_url}")
         return False
 
-    # Prefer Drive API (handles private files + avoids gdown confirmation issues)
+    # Prefer Drive API (handles private files + avoids download confirmation pages)
     if drive_service:
         make_file_public(drive_service, drive_url)
         try:
             from googleapiclient.http import MediaIoBaseDownload
             request = drive_service.files().get_media(fileId=file_id)
-            with open(dest_path, "wb") as f:
-                downloader = MediaIoBaseDownload(f, request)
+            part_path = dest_path + ".part"
+            with open(part_path, "wb") as f:
+                downloader = MediaIoBaseDownload(f, request, chunksize=DRIVE_MEDIA_CHUNK_SIZE)
                 done = False
                 while not done:
                     _, done = downloader.next_chunk()
-            return os.path.exists(dest_path) and os.path.getsize(dest_path) > 0
+            os.replace(part_path, dest_path)
+            return os.path.getsize(dest_path) > 0
         except Exception as e:
             log(f"    Drive API download failed: {e}")
             return False
 
-    # Fallback to gdown for public files with retry logic
+    # Fallback to a public download for public files with retry logic
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            # fuzzy=True helps with Google Drive's URL changes/redirects
-            gdown.download(
-                f"https://drive.google.com/uc?id={file_id}",
-                dest_path, quiet=True, fuzzy=True,
-            )
+            _download_public_drive_file(file_id, dest_path)
             if os.path.exists(dest_path) and os.path.getsize(dest_path) > 0:
                 # Add small delay after successful download to avoid bot detection
                 time.sleep(2)
@@ -556,138 +991,185 @@ def is_garbled_text(text):
     if not text:
         return True
     # Control characters (except space, newline, tab)
-    if any(ord(c) < 32 and c not in ("\n", "\r", "\t") for c in text):
+    if _CONTROL_CHAR_RE.search(text):
         return True
     # If the text contains Tamil characters, check for stray ASCII letters
-    # (Tamil Unicode range: U+0B80–U+0BFF)
-    has_tamil = any("\u0B80" <= c <= "\u0BFF" for c in text)
-    if has_tamil:
+    # (Tamil Unicode range: U+0B80–U+0BFF). Both are counted in C on the
+    # UTF-8 bytes: each Tamil character starts with one of two byte pairs,
+    # and ASCII letters are single bytes that can be kept by translate().
+    data = text.encode("utf-8")
+    tamil_chars = sum(data.count(prefix) for prefix in _TAMIL_UTF8_PREFIXES)
+    if tamil_chars:
         # Count ASCII letters that aren't part of common English words/patterns
-        ascii_letters = sum(1 for c in text if "A" <= c <= "Z" or "a" <= c <= "z")
-        tamil_chars = sum(1 for c in text if "\u0B80" <= c <= "\u0BFF")
+        ascii_letters = len(data.translate(None, _NON_ASCII_LETTER_BYTES))
         # If there's a significant mix of ASCII letters with Tamil, it's garbled
-        if tamil_chars > 0 and ascii_letters > 0 and ascii_letters / (tamil_chars + ascii_letters) > 0.1:
+        if ascii_letters > 0 and ascii_letters / (tamil_chars + ascii_letters) > 0.1:
             return True
     return False
 
 
-def translate_to_tamil(text, oauth_creds=None):
-    """Translate English text to Tamil using Google Cloud Translation API.
+def translate_to_tamil(texts, oauth_creds=None):
+    """Translate English texts to Tamil using Google Cloud Translation API.
+
+    Texts go out in as few requests as the API allows (it takes up to
+    TRANSLATE_BATCH_SIZE texts per request and bills per character either
+    way); duplicates are sent once and cached translations are not sent
+    at all.
 
     Args:
-        text: English text to translate
+        texts: List of English texts to translate
         oauth_creds: Optional OAuth credentials (from get_drive_service pattern)
                     If provided, uses OAuth. Otherwise tries service account via
                     GOOGLE_APPLICATION_CREDENTIALS env var.
 
-    Returns the translated Tamil text, or None on failure.
+    Returns a list matching texts: the translated Tamil text, or None where
+    the text was empty or translation failed.
     """
-    if not text or not text.strip():
-        return None
-
-    try:
-        # Method 1: Use OAuth credentials if provided (shares auth with Drive API)
-        if oauth_creds:
-            from googleapiclient.discovery import build
-            translate_service = build('translate', 'v2', credentials=oauth_creds)
+    translated = {}
+    cache_keys = {}  # unique texts still to translate -> cache key
+    for text in texts:
+        if not text or not text.strip() or text in translated or text in cache_keys:
+            continue
+        # Translations are cached on disk (the API bills per character)
+        cache_key = hashlib.sha1(text.encode("utf-8")).hexdigest() + ":en:ta"
+        cached = _cache_get("tr", cache_key)
+        if cached:
+            translated[text] = cached
+        else:
+            cache_keys[text] = cache_key
+    if translated:
+        log(f"    ✓ {len(translated)} Tamil translations found in cache")
 
-            result = translate_service.translations().list(
-                q=text,
-                source='en',
-                target='ta'
-            ).execute()
+    pending = list(cache_keys)
+    if pending:
+        try:
+            # Method 1: Use OAuth credentials if provided (shares auth with Drive API)
+            if oauth_creds:
+                from googleapiclient.discovery import build
+                translate_service = build('translate', 'v2', credentials=oauth_creds)
+
+                def translate_batch(batch):
+                    result = translate_service.translations().list(
+                        q=batch,
+                        source='en',
+                        target='ta'
+                    ).execute()
+                    return [t['translatedText'] for t in result['translations']]
+                method = "OAuth"
+
+            # Method 2: Fall back to service account credentials
+            elif HAS_TRANSLATE:
+                translate_client = translate.Client()
+
+                def translate_batch(batch):
+                    result = translate_client.translate(
+                        batch,
+                        source_language='en',
+                        target_language='ta'
+                    )
+                    return [t['translatedText'] for t in result]
+                method = "service account"
 
-            translated_text = result['translations'][0]['translatedText']
-            log(f"    ✓ Translated {len(text)} chars to Tamil (OAuth)")
-            return translated_text
-
-        # Method 2: Fall back to service account credentials
-        elif HAS_TRANSLATE:
-            translate_client = translate.Client()
-            result = translate_client.translate(
-                text,
-                source_language='en',
-                target_language='ta'
-            )
-            translated_text = result['translatedText']
-            log(f"    ✓ Translated {len(text)} chars to Tamil (service account)")
-            return translated_text
+            else:
+                log("    Google Cloud Translate unavailable (install: pip install google-cloud-translate)")
+                method = None
+
+            if method:
+                # Each batch is kept (and cached) as soon as it's back, so a
+                # failure part-way through only loses the remaining batches
+                for start in range(0, len(pending), TRANSLATE_BATCH_SIZE):
+                    batch = pending[start:start + TRANSLATE_BATCH_SIZE]
+                    for text, translated_text in zip(batch, translate_batch(batch)):
+                        translated[text] = translated_text
+                        _cache_put("tr", cache_keys[text], translated_text)
+                chars = sum(len(text) for text in pending)
+                log(f"    ✓ Translated {len(pending)} texts ({chars} chars) to Tamil ({method})")
 
-        else:
-            log("    Google Cloud Translate unavailable (install: pip install google-cloud-translate)")
-            return None
+        except Exception as e:
+            log(f"    Translation failed: {e}")
 
-    except Exception as e:
-        log(f"    Translation failed: {e}")
-        return None
+    return [translated.get(text) for text in texts]
 
 
-def ocr_pdf_page_tesseract(pdf_path, page_num, lang="tam"):
+def ocr_pdf_page_tesseract(doc, pdf_path, page_num, lang="tam"):
     """Render a PDF page to an image and OCR it with Tesseract.
 
     Used as a fallback when the PDF text layer has broken font encoding.
+    pdf_path is the file doc was opened from: results are cached on disk by
+    its contents, the page, the language and the DPI, like Gemini's.
     Returns the OCR'd text, or empty string on failure.
     """
     if not HAS_TESSERACT:
         log("    Tesseract unavailable (install pytesseract + Pillow: pip install pytesseract Pillow)")
         return ""
-    try:
-        doc = fitz.open(pdf_path)
-        page = doc[page_num]
-        # Render at 300 DPI for good OCR quality
-        pix = page.get_pixmap(dpi=300)
-        doc.close()
 
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        text = pytesseract.image_to_string(img, lang=lang)
-        return text.strip()
+    try:
+        cache_key = hashlib.sha1(
+            f"{_file_digest(pdf_path)}:{page_num}:tesseract:{lang}:{TESSERACT_OCR_DPI}".encode("utf-8")
+        ).hexdigest()
+    except OSError:
+        cache_key = None
+    cached = _cache_get("ocr", cache_key) if cache_key else None
+    if cached:
+        log("    ✓ Tesseract OCR result loaded from cache")
+        return cached
+
+    pix = img = None
+    try:
+        with _fitz_lock:
+            # Render straight to 8-bit gray: a third of the RGB pixel data, and
+            # Tesseract would convert to gray before binarizing anyway
+            pix = doc[page_num].get_pixmap(dpi=TESSERACT_OCR_DPI, colorspace=fitz.csGRAY)
+
+        # samples_mv is a view of the pixmap's own buffer; pix.samples would
+        # first copy the whole page into a bytes object
+        img = Image.frombuffer("L", (pix.width, pix.height), pix.samples_mv,
+                               "raw", "L", pix.stride, 1)
+        text = pytesseract.image_to_string(img, lang=lang).strip()
+        if text and cache_key:
+            _cache_put("ocr", cache_key, text)
+        return text
     except Exception as e:
         log(f"    Tesseract OCR failed: {e}")
         return ""
+    finally:
+        # Release the page image before the next one is rendered
+        with _fitz_lock:
+            img = pix = None
 
 
-def ocr_pdf_page_gemini(pdf_path, page_num, is_first_page=False, is_last_page=False):
-    """Render a PDF page to an image and OCR it with Google Gemini Vision API.
-
-    Uses Gemini's vision capabilities to extract text from Tamil PDFs.
-    Requires GEMINI_API_KEY environment variable to be set.
-    Returns the OCR'd text, or empty string on failure.
+def _gemini_retry_delay(error_str, retry_count, base=2, cap=120):
+    """Seconds to wait before retrying a rate-limited Gemini request.
 
-    Handles rate limiting (429 errors) with automatic retry and delay.
+    Exponential backoff (base * 2**retry_count, capped), raised to the
+    server's suggested retry delay plus a 2s buffer when the error carries
+    one, with 0-20% jitter so concurrent workers don't retry in lockstep.
     """
-    if not HAS_GEMINI:
-        log("    Gemini unavailable (install: pip install google-generativeai)")
-        return ""
-
-    api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        log("    Error: GEMINI_API_KEY environment variable not set")
-        return ""
-
-    max_retries = 3
-    retry_count = 0
-
-    # Render PDF page to image (do this once, outside the retry loop)
-    try:
-        doc = fitz.open(pdf_path)
-        page = doc[page_num]
-        # Render at 300 DPI for good quality
-        pix = page.get_pixmap(dpi=300)
-        doc.close()
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-    except Exception as e:
-        log(f"    Failed to render PDF page: {e}")
-        return ""
-
-    # Configure Gemini
-    genai.configure(api_key=api_key)
+    delay = min(cap, base * (2 ** retry_count))
+    match = _RETRY_DELAY_RE.search(error_str)
+    if match:
+        delay = max(delay, float(match.group(1) or match.group(2)) + 2)
+    return delay * (1 + random.uniform(0, 0.2))
+
+
+def _get_gemini_model(api_key):
+    """Configure Gemini and build the OCR model once, on first use."""
+    global _gemini_model
+    with _gemini_lock:
+        if _gemini_model is None:
+            genai.configure(api_key=api_key)
+            _gemini_model = genai.GenerativeModel(
+                GEMINI_MODEL,
+                generation_config=GEMINI_GENERATION_CONFIG,
+                safety_settings=GEMINI_SAFETY_SETTINGS,
+            )
+        return _gemini_model
 
-    # Use Gemini Vision to extract text
-    model = genai.GenerativeModel('gemini-2.5-pro')
 
-    # Customize prompt based on page type
+def _gemini_prompt(is_first_page=False, is_last_page=False):
+    """Return the OCR instructions for a first, last or other storybook page."""
     if is_first_page:
-        prompt = (
+        return (
             "This is the first page of a Tamil children's storybook. "
             "Extract all text from this image in reading order (top to bottom). "
             "Include the story title, author, translator, and any other text. "
@@ -695,7 +1177,7 @@ def ocr_pdf_page_gemini(pdf_path, page_num, is_first_page=False, is_last_page=Fa
             "Return only the text content, one line per text element, without any commentary."
         )
     elif is_last_page:
-        prompt = (
+        return (
             "This is the last page of a Tamil children's storybook. "
             "It contains a story description/summary. "
             "Extract all text from this image in reading order. "
@@ -705,21 +1187,153 @@ def ocr_pdf_page_gemini(pdf_path, page_num, is_first_page=False, is_last_page=Fa
             "Return only the text content, one line per text element, without any commentary."
         )
     else:
-        prompt = (
+        return (
             "Extract all text from this image. This is a page from a Tamil children's storybook. "
             "Please preserve the exact text layout and return only the text content without any additional commentary."
         )
 
+
+def _gemini_cache_key(pdf_path, page_num, model, prompt):
+    """Cache key for a page's Gemini OCR: PDF contents, page, model and prompt.
+
+    Returns None if the PDF can't be read.
+    """
+    try:
+        return hashlib.sha1(
+            f"{_file_digest(pdf_path)}:{page_num}:{model.model_name}:{prompt}".encode("utf-8")
+        ).hexdigest()
+    except OSError:
+        return None
+
+
+def _gemini_page_image(doc, page_num):
+    """Render a PDF page as the JPEG image part of a Gemini request.
+
+    The DPI is chosen so the longer side lands near GEMINI_OCR_LONG_SIDE,
+    and the page is sent as JPEG rather than a full-size raw RGB image.
+    """
+    with _fitz_lock:
+        page = doc[page_num]
+        page_long = max(page.rect.width, page.rect.height)
+        dpi = max(GEMINI_OCR_MIN_DPI,
+                  min(GEMINI_OCR_MAX_DPI, int(GEMINI_OCR_LONG_SIDE * 72 / page_long)))
+        data = page.get_pixmap(dpi=dpi).tobytes("jpeg", jpg_quality=85)
+        del page
+    return {"mime_type": "image/jpeg", "data": data}
+
+
+def prefetch_gemini_ocr(doc, pdf_path):
+    """OCR a PDF's first and last pages with one Gemini request.
+
+    Garbled Tamil PDFs need both pages OCR'd (title and description). When
+    both pages' text layers look garbled and neither is cached yet, both
+    images go out in a single request asking for a JSON object with each
+    page's text, and the results are stored in the OCR cache under the
+    same keys ocr_pdf_page_gemini() uses, so the per-page calls that follow
+    are cache hits. Any failure just leaves them to make their own requests.
+    """
+    if not HAS_GEMINI or _gemini_quota_exhausted.is_set():
+        return
+    last = _page_count(doc) - 1
+    if last < 1:
+        return
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        return
+
+    if not (is_garbled_text("\n".join(_page_lines(doc, 0)))
+            and is_garbled_text("\n".join(_page_lines(doc, last)))):
+        return
+
+    model = _get_gemini_model(api_key)
+    first_prompt = _gemini_prompt(is_first_page=True)
+    last_prompt = _gemini_prompt(is_last_page=True)
+    first_key = _gemini_cache_key(pdf_path, 0, model, first_prompt)
+    last_key = _gemini_cache_key(pdf_path, last, model, last_prompt)
+    if not first_key or not last_key or _cache_get("ocr", first_key) or _cache_get("ocr", last_key):
+        return
+
+    try:
+        GEMINI_LIMITER.acquire()
+        response = model.generate_content(
+            [
+                "Two pages of a Tamil children's storybook follow. "
+                'Answer with a JSON object {"first_page": "...", "last_page": "..."} '
+                "holding the text of each page, following that page's instructions.",
+                "First page instructions: " + first_prompt,
+                _gemini_page_image(doc, 0),
+                "Last page instructions: " + last_prompt,
+                _gemini_page_image(doc, last),
+            ],
+            generation_config={"response_mime_type": "application/json"},
+        )
+        pages = json.loads(response.text)
+        first_text = pages["first_page"].strip()
+        last_text = pages["last_page"].strip()
+    except Exception as e:
+        log(f"    Batched Gemini OCR failed ({e}), OCR'ing pages one at a time")
+        return
+
+    if first_text:
+        _cache_put("ocr", first_key, first_text)
+    if last_text:
+        _cache_put("ocr", last_key, last_text)
+    log("    ✓ OCR'd first and last pages in one Gemini request")
+
+
+def ocr_pdf_page_gemini(doc, pdf_path, page_num, is_first_page=False, is_last_page=False):
+    """Render a PDF page to an image and OCR it with Google Gemini Vision API.
+
+    Uses Gemini's vision capabilities to extract text from Tamil PDFs.
+    Requires GEMINI_API_KEY environment variable to be set.
+    Returns the OCR'd text, or empty string on failure.
+
+    Handles rate limiting (429 errors) with automatic retry and delay.
+    """
+    if not HAS_GEMINI:
+        log("    Gemini unavailable (install: pip install google-generativeai)")
+        return ""
+
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        log("    Error: GEMINI_API_KEY environment variable not set")
+        return ""
+
+    max_retries = 8
+    retry_count = 0
+
+    # Use Gemini Vision to extract text
+    model = _get_gemini_model(api_key)
+
+    # Customize prompt based on page type
+    prompt = _gemini_prompt(is_first_page=is_first_page, is_last_page=is_last_page)
+
+    # Results are cached on disk by PDF contents, page, model and prompt
+    cache_key = _gemini_cache_key(pdf_path, page_num, model, prompt)
+    cached = _cache_get("ocr", cache_key) if cache_key else None
+    if cached:
+        log("    ✓ Gemini OCR result loaded from cache")
+        return cached
+
+    if _gemini_quota_exhausted.is_set():
+        return ""
+
+    # Render PDF page to image (do this once, outside the retry loop)
+    try:
+        img = _gemini_page_image(doc, page_num)
+    except Exception as e:
+        log(f"    Failed to render PDF page: {e}")
+        return ""
+
     # Retry loop for rate limiting
     while retry_count <= max_retries:
         try:
+            # Wait only as long as needed to stay within the rate limit
+            GEMINI_LIMITER.acquire()
             response = model.generate_content([prompt, img])
             text = response.text.strip()
-
-            # Add a small delay after successful request to avoid rate limiting
-            # Free tier: 5 requests per minute = 12 seconds between requests
-            time.sleep(13)
-
+            if text and cache_key:
+                _cache_put("ocr", cache_key, text)
             return text
 
         except Exception as e:
@@ -727,15 +1341,16 @@ def ocr_pdf_page_gemini(pdf_path, page_num, is_first_page=False, is_last_page=Fa
 
             # Check if it's a rate limit error (429)
             if "429" in error_str or "quota" in error_str.lower() or "rate" in error_str.lower():
-                # Extract retry delay from error message if available
-                retry_delay = 15  # Default delay
-                import re
-                delay_match = re.search(r'retry in (\d+\.?\d*)', error_str)
-                if delay_match:
-                    retry_delay = float(delay_match.group(1)) + 2  # Add 2 seconds buffer
+                # A spent daily quota won't recover by waiting: stop using Gemini
+                if _DAILY_QUOTA_RE.search(error_str):
+                    _gemini_quota_exhausted.set()
+                    log("    Gemini daily quota exhausted; skipping Gemini OCR for the rest of this run "
+                        "(try again tomorrow, upgrade the API tier, or use --ocr tesseract)")
+                    return ""
 
                 retry_count += 1
                 if retry_count <= max_retries:
+                    retry_delay = _gemini_retry_delay(error_str, retry_count)
                     log(f"    Rate limit hit. Waiting {retry_delay:.0f}s before retry {retry_count}/{max_retries}...")
                     time.sleep(retry_delay)
                 else:
@@ -749,15 +1364,35 @@ def ocr_pdf_page_gemini(pdf_path, page_num, is_first_page=False, is_last_page=Fa
     return ""
 
 
-def ocr_pdf_page(pdf_path, page_num, lang="tam", is_first_page=False, is_last_page=False):
-    """OCR a PDF page using the configured backend (Tesseract or Gemini).
+def ocr_pdf_page(doc, pdf_path, page_num, lang="tam", is_first_page=False, is_last_page=False):
+    """OCR a page of an open PDF using the configured backend (Tesseract or Gemini).
+
+    pdf_path is the file doc was opened from (OCR results are cached by its
+    contents).
 
     Returns the OCR'd text, or empty string on failure.
     """
     if OCR_BACKEND == "gemini":
-        return ocr_pdf_page_gemini(pdf_path, page_num, is_first_page=is_first_page, is_last_page=is_last_page)
+        return ocr_pdf_page_gemini(doc, pdf_path, page_num, is_first_page=is_first_page, is_last_page=is_last_page)
     else:
-        return ocr_pdf_page_tesseract(pdf_path, page_num, lang=lang)
+        return ocr_pdf_page_tesseract(doc, pdf_path, page_num, lang=lang)
+
+
+def _page_lines(doc, page_num):
+    """Return the non-empty, stripped text lines of a PDF page in reading order.
+
+    Lines come from the page's text blocks sorted top to bottom (then left
+    to right) by their bounding boxes, so the order follows the layout even
+    when the PDF draws its text in another order. Block mode is also
+    cheaper than assembling the page's plain text.
+    """
+    with _fitz_lock:
+        blocks = sorted(
+            (y0, x0, text)
+            for x0, y0, _, _, text, _, block_type in doc[page_num].get_text("blocks")
+            if block_type == 0  # text, not image
+        )
+    return [line.strip() for _, _, text in blocks for line in text.split("\n") if line.strip()]
 
 
 def _parse_page1_lines(lines):
@@ -765,29 +1400,15 @@ def _parse_page1_lines(lines):
 
     Skips common headers/logos that appear before the actual title.
     """
-    # Common headers/logos to skip (case-insensitive)
-    skip_patterns = [
-        r'^EETHAL$',
-        r'^Pratham\s*Books?$',
-        r'^StoryWeaver$',
-        r'^www\.',
-        r'^http',
-        r'^\d+$',  # Just numbers
-        r'^```+$',  # Markdown code fences
-        r'^[*#-]+$',  # Special characters only
-    ]
-
     # Find the first line that's not a header/logo
     title = ""
     for line in lines:
-        # Skip empty lines
-        if not line.strip():
-            continue
-        # Skip lines matching skip patterns
-        if any(re.match(pattern, line.strip(), re.IGNORECASE) for pattern in skip_patterns):
+        stripped = line.strip()
+        # Skip empty lines and lines matching skip patterns
+        if not stripped or _TITLE_SKIP_RE.match(stripped):
             continue
         # This is likely the title
-        title = line.strip()
+        title = stripped
         break
 
     # If no title found, fall back to first non-empty line
@@ -796,7 +1417,7 @@ def _parse_page1_lines(lines):
 
     translator = ""
     for line in lines:
-        m = re.match(r"(?:Translator|Translated by)[:\s]+(.+)", line, re.IGNORECASE)
+        m = _TRANSLATOR_RE.match(line)
         if m:
             translator = m.group(1).strip()
             break
@@ -804,9 +1425,16 @@ def _parse_page1_lines(lines):
     return {"title": title, "translator": translator}
 
 
-def extract_page1_info(pdf_path, is_tamil=False):
+def _page1_cacheable(result, is_tamil):
+    """Cache page 1 results only if a (readable) title was found."""
+    return bool(result["title"]) and not (is_tamil and is_garbled_text(result["title"]))
+
+
+@_cached_by_pdf("Page 1 info", _page1_cacheable)
+def extract_page1_info(doc, pdf_path, is_tamil=False):
     """
-    Extract the story title and translator name from page 1 of a PDF.
+    Extract the story title and translator name from page 1 of an open PDF
+    (doc, read from the file at pdf_path).
 
     First tries PyMuPDF text extraction. For Tamil PDFs, if the result is
     garbled (broken font encoding), falls back to OCR via Tesseract.
@@ -814,21 +1442,17 @@ def extract_page1_info(pdf_path, is_tamil=False):
     Returns a dict with 'title' and 'translator' keys.
     """
     try:
-        doc = fitz.open(pdf_path)
-        first_page = doc[0]
-        text = first_page.get_text()
-        doc.close()
+        lines = _page_lines(doc, 0)
 
-        if not text:
+        if not lines:
             return {"title": "", "translator": ""}
 
-        lines = [line.strip() for line in text.strip().split("\n") if line.strip()]
         result = _parse_page1_lines(lines)
 
         # For Tamil PDFs, check if the title is garbled and try OCR
         if is_tamil and is_garbled_text(result["title"]):
             log("    Text layer garbled — trying OCR on page 1...")
-            ocr_text = ocr_pdf_page(pdf_path, 0, lang="tam", is_first_page=True)
+            ocr_text = ocr_pdf_page(doc, pdf_path, 0, lang="tam", is_first_page=True)
             if ocr_text:
                 ocr_lines = [l.strip() for l in ocr_text.split("\n") if l.strip()]
                 ocr_result = _parse_page1_lines(ocr_lines)
@@ -842,6 +1466,10 @@ def extract_page1_info(pdf_path, is_tamil=False):
         return {"title": "", "translator": ""}
 
 
+# The line classifiers below are pure string predicates, and Pratham Books
+# stories share the same front/back-matter templates, so the same lines come
+# up again and again across a run; classify each distinct line once
+@functools.lru_cache(maxsize=8192)
 def _is_footer_line(line):
     """Check if a line is part of the Pratham Books footer or metadata (works with OCR typos)."""
     lower = line.lower()
@@ -870,6 +1498,7 @@ def _is_footer_line(line):
     return False
 
 
+@functools.lru_cache(maxsize=8192)
 def _is_level_marker(line):
     """Check if a line is the level/reading-level marker."""
     lower = line.lower()
@@ -881,6 +1510,7 @@ def _is_level_marker(line):
     return False
 
 
+@functools.lru_cache(maxsize=8192)
 def _is_level_description(line):
     """Check if a line is the reading level description (not the story description).
 
@@ -892,11 +1522,11 @@ def _is_level_description(line):
     stripped = line.strip()
 
     # Just "Level N" by itself (very common false positive)
-    if re.match(r'^Level\s+\d+\s*$', stripped, re.IGNORECASE):
+    if _LEVEL_ONLY_RE.match(stripped):
         return True
 
     # Just "நிலை N" in Tamil
-    if re.match(r'^நிலை\s*\d+\s*$', stripped):
+    if _TAMIL_LEVEL_ONLY_RE.match(stripped):
         return True
 
     # English level descriptions
@@ -917,6 +1547,7 @@ def _is_level_description(line):
     return False
 
 
+@functools.lru_cache(maxsize=8192)
 def _is_valid_description(text):
     """Check if extracted text is a valid story description.
 
@@ -931,9 +1562,9 @@ def _is_valid_description(text):
     stripped = text.strip()
 
     # Just level markers
-    if re.match(r'^Level\s+\d+\s*$', stripped, re.IGNORECASE):
+    if _LEVEL_ONLY_RE.match(stripped):
         return False
-    if re.match(r'^நிலை\s*\d+\s*$', stripped):
+    if _TAMIL_LEVEL_ONLY_RE.match(stripped):
         return False
 
     # Check if it's a level description (not story description)
@@ -952,13 +1583,13 @@ def _clean_description(text):
         return text
 
     # Remove trailing StoryWeaver references (case-insensitive)
-    text = re.sub(r'\s*(?:story\s*weaver|storyweaver)\s*$', '', text, flags=re.IGNORECASE)
+    text = _TRAILING_STORYWEAVER_RE.sub('', text)
 
     # Remove trailing URLs or website references
-    text = re.sub(r'\s*(?:www\.|http)[^\s]*\s*$', '', text, flags=re.IGNORECASE)
+    text = _TRAILING_URL_RE.sub('', text)
 
     # Remove trailing punctuation that might be left over
-    text = re.sub(r'\s*[,\.\-]+\s*$', '', text)
+    text = _TRAILING_PUNCT_RE.sub('', text)
 
     return text.strip()
 
@@ -1029,14 +1660,21 @@ def _parse_description_lines(lines):
     return description if description else None
 
 
-def extract_description_from_pdf(pdf_path, is_tamil=False):
+def _description_cacheable(description, is_tamil):
+    """Cache descriptions only if one was found (not a "[...]" placeholder) and is readable."""
+    return not description.startswith("[") and not (is_tamil and is_garbled_text(description))
+
+
+@_cached_by_pdf("Description", _description_cacheable)
+def extract_description_from_pdf(doc, pdf_path, is_tamil=False):
     """
-    Extract the story description from the last page of a PDF.
+    Extract the story description from the last page of an open PDF
+    (doc, read from the file at pdf_path).
 
     First tries PyMuPDF text extraction. For Tamil PDFs, if the result is
     garbled, falls back to OCR via Tesseract.
 
-    PyMuPDF line order on last page:
+    Line order on last page (top to bottom):
       1. Level marker line ("This is a Level..." or Tamil equivalent)
       2. (English) or (Tamil)
       3. Title
@@ -1044,22 +1682,20 @@ def extract_description_from_pdf(pdf_path, is_tamil=False):
       5. "Pratham Books goes digital..."
     """
     try:
-        doc = fitz.open(pdf_path)
-        last_page = doc[-1]
-        text = last_page.get_text()
-        doc.close()
+        last_page = _page_count(doc) - 1
+        lines = _page_lines(doc, last_page)
 
-        if not text:
+        if not lines:
             return "[No text found on last page]"
 
-        lines = [line.strip() for line in text.strip().split("\n") if line.strip()]
         description = _parse_description_lines(lines)
 
-        # For Tamil PDFs, check if the description is garbled and try OCR
-        if is_tamil and (description is None or is_garbled_text(description)):
+        # For Tamil PDFs, check if the description is garbled and try OCR.
+        # If no description was found in a text layer that reads cleanly,
+        # OCR would only see the same words, so it is skipped.
+        if is_tamil and is_garbled_text("\n".join(lines) if description is None else description):
             log("    Text layer garbled — trying OCR on last page...")
-            page_count = fitz.open(pdf_path).page_count
-            ocr_text = ocr_pdf_page(pdf_path, page_count - 1, lang="tam", is_last_page=True)
+            ocr_text = ocr_pdf_page(doc, pdf_path, last_page, lang="tam", is_last_page=True)
             if ocr_text:
                 ocr_lines = [l.strip() for l in ocr_text.split("\n") if l.strip()]
                 ocr_desc = _parse_description_lines(ocr_lines)
@@ -1075,12 +1711,227 @@ def extract_description_from_pdf(pdf_path, is_tamil=False):
         return f"[Error reading PDF: {e}]"
 
 
+def _thread_services(oauth_creds, drive_service, sheets_service):
+    """Return (drive_service, sheets_service) for the current worker thread.
+
+    googleapiclient service objects share one httplib2 connection, which is
+    not thread-safe, so each worker thread builds its own from the shared
+    OAuth credentials (None stays None when the main thread has no service).
+    """
+    services = getattr(_thread_local, "services", None)
+    if services is None:
+        from googleapiclient.discovery import build
+        services = (
+            build("drive", "v3", credentials=oauth_creds, cache_discovery=False) if drive_service else None,
+            get_sheets_service(oauth_creds) if sheets_service else None,
+        )
+        _thread_local.services = services
+    return services
+
+
+def prefetch_story_pdfs(idx, story, tmpdir, fetch_eng=True, fetch_tam=True,
+                        drive_service=None, oauth_creds=None):
+    """Download one story's PDFs ahead of process_story(), on a background thread.
+
+    Saves to the same temp paths process_story() uses. The download log is
+    held back instead of printed, so it can be shown in the story's own log.
+
+    Returns {"eng"|"tam": (downloaded, log text)} for each PDF fetched.
+    """
+    if oauth_creds:
+        drive_service, _ = _thread_services(oauth_creds, drive_service, None)
+    downloads = {}
+    for lang, wanted in (("eng", fetch_eng), ("tam", fetch_tam)):
+        if not (wanted and story[f"pdf_{lang}"]):
+            continue
+        pdf_path = os.path.join(tmpdir, f"{lang}_{idx}.pdf")
+        _thread_local.output = io.StringIO()
+        try:
+            ok = download_pdf(story[f"pdf_{lang}"], pdf_path, drive_service)
+            downloads[lang] = (ok, _thread_local.output.getvalue())
+        finally:
+            _thread_local.output = None
+    return downloads
+
+
+def process_story(idx, story, total, tmpdir, start_time, fetch_eng=True, fetch_tam=True,
+                  drive_service=None, sheets_service=None, oauth_creds=None, prefetched=None,
+                  translation_enabled=True):
+    """Download one story's PDFs and extract its title, translator and descriptions.
+
+    Safe to run on a worker thread: temp files are named by idx, and the
+    Drive/Sheets services passed in must belong to the calling thread.
+    prefetched is an optional future of prefetch_story_pdfs() for this
+    story, whose downloads are then used instead of fetching the PDFs here.
+    Without translation_enabled, the Tamil description is always read from
+    the Tamil PDF rather than left to be translated from the English one.
+
+    Returns (pending_translation, row): row is the output row for the
+    story (PDF-extracted values, falling back to the spreadsheet's), and
+    pending_translation is None or, when the Tamil description is still to be translated, the
+    (English description, Tamil PDF path) pair to finish it with
+    finish_tamil_descriptions().
+    """
+    elapsed = time.time() - start_time
+    _print(f"\n{'='*70}")
+    _print(f"[{idx}/{total}] Row {story['row_num']}: {story['english_title']} / {story['tamil_title']}  (elapsed: {elapsed:.0f}s)")
+    _print(f"{'='*70}")
+
+    eng_desc = ""
+    tam_desc = ""
+    eng_pdf_title = ""
+    tam_pdf_title = ""
+    translator = ""
+    image_url = None
+    pending_translation = None
+
+    def fetch(lang, pdf_path):
+        if prefetched is None:
+            return download_pdf(story[f"pdf_{lang}"], pdf_path, drive_service)
+        ok, download_log = prefetched.result()[lang]
+        _print(download_log, end="")
+        return ok
+
+    # English PDF
+    if fetch_eng and story["pdf_eng"]:
+        pdf_path = os.path.join(tmpdir, f"eng_{idx}.pdf")
+        log(f"    Downloading English PDF...")
+        doc = open_pdf(pdf_path) if fetch("eng", pdf_path) else None
+        if doc is not None:
+            with closing_pdf(doc):
+                page1 = extract_page1_info(doc, pdf_path)
+                eng_pdf_title = page1["title"]
+                if page1["translator"]:
+                    translator = page1["translator"]
+                _print(f"  >> English title (from PDF): {eng_pdf_title}")
+                if translator:
+                    _print(f"  >> Translator: {translator}")
+
+                eng_desc = extract_description_from_pdf(doc, pdf_path)
+                _print(f"  >> English description: {eng_desc}")
+
+                # Extract and upload cover image
+                image_url = process_cover_image(
+                    doc, story, drive_service, sheets_service, tmpdir, idx
+                )
+        else:
+            eng_desc = "[Download failed]"
+            _print(f"  >> English: {eng_desc}")
+    elif fetch_eng:
+        _print("  English PDF: [not available]")
+
+    # Tamil: Always download PDF for title, but translate description from English
+    if fetch_tam and story["pdf_tam"]:
+        pdf_path = os.path.join(tmpdir, f"tam_{idx}.pdf")
+        log(f"    Downloading Tamil PDF...")
+        doc = open_pdf(pdf_path) if fetch("tam", pdf_path) else None
+        if doc is not None:
+            with closing_pdf(doc):
+                translate_desc = (translation_enabled and eng_desc
+                                  and eng_desc != "[Download failed]")
+
+                # Always extract Tamil title from PDF. Without an English
+                # description to translate, the last page is needed too.
+                # The pages are read one after the other; with Gemini, the OCR
+                # of a garbled first and last page is fetched in one request.
+                pdf_tam_desc = None
+                if not translate_desc and OCR_BACKEND == "gemini":
+                    prefetch_gemini_ocr(doc, pdf_path)
+                page1 = extract_page1_info(doc, pdf_path, is_tamil=True)
+                if not translate_desc:
+                    pdf_tam_desc = extract_description_from_pdf(doc, pdf_path, is_tamil=True)
+                tam_pdf_title = page1["title"]
+                if not translator and page1["translator"]:
+                    translator = page1["translator"]
+                _print(f"  >> Tamil title (from PDF): {tam_pdf_title}")
+
+                # For description: prefer translation, fallback to PDF extraction.
+                # Translations are batched across stories by the caller, which
+                # falls back to the PDF for any that fail.
+                if translate_desc:
+                    pending_translation = (eng_desc, pdf_path)
+                else:
+                    # Nothing to translate, use the one read from the Tamil PDF
+                    tam_desc = pdf_tam_desc
+                    _print(f"  >> Tamil description (from PDF): {tam_desc}")
+        else:
+            _print(f"  >> Tamil PDF: [Download failed]")
+    elif fetch_tam:
+        _print("  Tamil PDF: [not available]")
+
+    # Use PDF-extracted values if available, fall back to spreadsheet values
+    return pending_translation, {
+        "english_title": eng_pdf_title or story["english_title"],
+        "tamil_title": tam_pdf_title or story["tamil_title"],
+        "pdf_eng": story["pdf_eng"],
+        "pdf_tam": story["pdf_tam"],
+        "image": image_url or story["image"],
+        "sw_link_eng": story["sw_link_eng"],
+        "sw_link_tam": story["sw_link_tam"],
+        "translators": translator or story["translators"],
+        "english_description": eng_desc or story["english_description"],
+        "tamil_description": tam_desc or story["tamil_description"],
+        "status": story["status"],
+        "tags": story["tags"],
+    }
+
+
+def finish_tamil_descriptions(results, oauth_creds=None, jobs=1):
+    """Translate the English descriptions process_story() left pending.
+
+    All pending descriptions are translated in one batch; a story whose
+    translation fails gets its description from its Tamil PDF instead.
+
+    Args:
+        results: (pending_translation, row) pairs from process_story(), in story order;
+                 the rows are updated in place
+        oauth_creds: Optional OAuth credentials for the Translation API
+        jobs: Number of Tamil PDFs to read at once for failed translations
+    """
+    pending = [(idx, pending_translation, row)
+               for idx, (pending_translation, row) in enumerate(results, 1)
+               if pending_translation]
+    if not pending:
+        return
+
+    log(f"Translating {len(pending)} English descriptions to Tamil...")
+    translations = translate_to_tamil([eng_desc for _, (eng_desc, _), _ in pending],
+                                      oauth_creds=oauth_creds)
+
+    def finish(item):
+        (idx, (_, pdf_path), row), tam_desc = item
+        if tam_desc:
+            _print(f"  [{idx}/{len(results)}] Tamil description (translated): {tam_desc[:100]}...")
+        else:
+            log(f"    [{idx}/{len(results)}] Translation failed, extracting from Tamil PDF...")
+            doc = open_pdf(pdf_path)
+            if doc is not None:
+                with closing_pdf(doc):
+                    tam_desc = extract_description_from_pdf(doc, pdf_path, is_tamil=True)
+            _print(f"  [{idx}/{len(results)}] Tamil description (from PDF): {tam_desc}")
+        row["tamil_description"] = tam_desc or row["tamil_description"]
+
+    items = zip(pending, translations)
+    if jobs == 1:
+        for item in items:
+            finish(item)
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            list(pool.map(finish, items))
+
 
 def main():
-    global QUIET, OCR_BACKEND
+    global QUIET, OCR_BACKEND, TESSERACT_OCR_DPI, GEMINI_MODEL, GEMINI_LIMITER
     args = parse_args()
     QUIET = args.quiet
     OCR_BACKEND = args.ocr
+    TESSERACT_OCR_DPI = args.ocr_dpi
+    GEMINI_MODEL = args.gemini_model
+    if args.gemini_rpm is not None and args.gemini_rpm <= 0:
+        print("Error: --gemini-rpm must be positive.", file=sys.stderr)
+        sys.exit(1)
+    gemini_rpm = args.gemini_rpm or GEMINI_FREE_TIER_RPM.get(GEMINI_MODEL, GEMINI_DEFAULT_RPM)
+    GEMINI_LIMITER = RateLimiter(gemini_rpm / 60)
 
     # Validate OCR backend availability
     if OCR_BACKEND == "gemini":
@@ -1101,7 +1952,7 @@ def main():
                 file=sys.stderr,
             )
             sys.exit(1)
-        log("Using Gemini Vision API for OCR")
+        log(f"Using Gemini Vision API ({GEMINI_MODEL}) for OCR")
     elif OCR_BACKEND == "tesseract":
         if not HAS_TESSERACT:
             print(
@@ -1120,12 +1971,9 @@ def main():
         print(f"Error fetching spreadsheet: {e}", file=sys.stderr)
         sys.exit(1)
 
-    all_rows = parse_all_rows(csv_text)
-    max_row = all_rows[-1]["row_num"] if all_rows else 1
-
     if args.rows:
         # Parse range like "5-10" or single number like "7" (spreadsheet row numbers)
-        match = re.match(r'^(\d+)(?:-(\d+))?$', args.rows)
+        match = _ROWS_RE.match(args.rows)
         if not match:
             print(f"Error: invalid --rows format '{args.rows}'. Use e.g. '5-10' or '7'.",
                   file=sys.stderr)
@@ -1138,29 +1986,51 @@ def main():
         if row_end < row_start:
             print(f"Error: invalid --rows range {row_start}-{row_end}.", file=sys.stderr)
             sys.exit(1)
+
+    fetch_eng = args.lang in ("both", "eng")
+    fetch_tam = args.lang in ("both", "tam")
+    limit = args.limit if not args.rows and args.limit > 0 else None
+
+    # Keep the rows with SW links (within the requested spreadsheet row
+    # range, if any, up to --limit, and not yet complete with
+    # --skip-if-complete) and count the PDFs they need, in a single pass
+    # over the spreadsheet
+    stories = []
+    total_pdfs = 0
+    skipped = 0
+    max_row = 1
+    for row in iter_all_rows(csv_text):
+        max_row = row["row_num"]
+        if args.rows and max_row < row_start:
+            continue
+        if args.rows and max_row > row_end:
+            break  # past the range; max_row still shows row_start exists
+        if not (row["sw_link_eng"] or row["sw_link_tam"]):
+            continue
+        if args.skip_if_complete and all(row[field] for field in COMPLETE_ROW_FIELDS):
+            skipped += 1
+            continue
+        stories.append(row)
+        total_pdfs += bool(fetch_eng and row["pdf_eng"]) + bool(fetch_tam and row["pdf_tam"])
+        if len(stories) == limit:
+            break
+
+    if skipped:
+        log(f"Skipped {skipped} complete rows.")
+
+    if args.rows:
         if row_start > max_row:
             print(f"Error: start row {row_start} exceeds last data row ({max_row}).",
                   file=sys.stderr)
             sys.exit(1)
-        # Filter to the requested spreadsheet row range, then to SW-link rows
-        rows_in_range = [r for r in all_rows if row_start <= r["row_num"] <= row_end]
-        stories = [r for r in rows_in_range if r["sw_link_eng"] or r["sw_link_tam"]]
         if not stories:
             print(f"No stories with SW links found in rows {row_start}-{row_end}.")
             sys.exit(0)
         log(f"Processing {len(stories)} stories from spreadsheet rows {row_start}-{row_end}.")
-    else:
-        stories = [r for r in all_rows if r["sw_link_eng"] or r["sw_link_tam"]]
 
-    if not args.rows and args.limit > 0:
-        stories = stories[:args.limit]
-        log(f"Limited to first {args.limit} stories.")
+    if limit:
+        log(f"Limited to first {limit} stories.")
 
-    fetch_eng = args.lang in ("both", "eng")
-    fetch_tam = args.lang in ("both", "tam")
-    total_pdfs = sum((1 if fetch_eng and s["pdf_eng"] else 0) +
-                     (1 if fetch_tam and s["pdf_tam"] else 0)
-                     for s in stories)
     log(f"Found {len(stories)} stories with SW links, {total_pdfs} PDFs to process.")
 
     if not stories:
@@ -1184,96 +2054,65 @@ def main():
             except Exception as e:
                 log(f"Sheets API initialization failed ({e}), image URLs will not be written to spreadsheet.")
 
-    # Step 3: Download PDFs and extract descriptions + page 1 info
+    # Translation goes through OAuth, or else a service account
+    # (see translate_to_tamil); with neither, read Tamil descriptions from
+    # the Tamil PDFs straight away instead of after a failed translation
+    translation_enabled = bool(oauth_creds) or HAS_TRANSLATE
+    if fetch_tam and not translation_enabled:
+        log("Translation unavailable, Tamil descriptions will be read from the Tamil PDFs.")
+
+    # Step 3: Download PDFs and extract descriptions + page 1 info.
+    # Stories are independent and mostly wait on the network, so with
+    # --jobs N up to N of them are processed at once; results keep the
+    # spreadsheet order.
     start_time = time.time()
-    results = []
+    jobs = max(1, args.jobs)
+    if jobs > 1:
+        log(f"Processing up to {jobs} stories concurrently.")
+        if OCR_BACKEND == "tesseract":
+            # Each Tesseract process would otherwise start a thread per core
+            os.environ.setdefault("OMP_THREAD_LIMIT", str(max(1, (os.cpu_count() or 1) // jobs)))
 
     with tempfile.TemporaryDirectory() as tmpdir:
-        for idx, story in enumerate(stories, 1):
-            elapsed = time.time() - start_time
-            print(f"\n{'='*70}")
-            print(f"[{idx}/{len(stories)}] Row {story['row_num']}: {story['english_title']} / {story['tamil_title']}  (elapsed: {elapsed:.0f}s)")
-            print(f"{'='*70}")
-
-            eng_desc = ""
-            tam_desc = ""
-            eng_pdf_title = ""
-            tam_pdf_title = ""
-            translator = ""
-            image_url = None
-
-            # English PDF
-            if fetch_eng and story["pdf_eng"]:
-                pdf_path = os.path.join(tmpdir, f"eng_{idx}.pdf")
-                log(f"    Downloading English PDF...")
-                if download_pdf(story["pdf_eng"], pdf_path, drive_service):
-                    page1 = extract_page1_info(pdf_path)
-                    eng_pdf_title = page1["title"]
-                    if page1["translator"]:
-                        translator = page1["translator"]
-                    print(f"  >> English title (from PDF): {eng_pdf_title}")
-                    if translator:
-                        print(f"  >> Translator: {translator}")
-
-                    eng_desc = extract_description_from_pdf(pdf_path)
-                    print(f"  >> English description: {eng_desc}")
-
-                    # Extract and upload cover image
-                    image_url = process_cover_image(
-                        pdf_path, story, drive_service, sheets_service, tmpdir, idx
+        def run(item, prefetched=None):
+            idx, story = item
+            drive, sheets = drive_service, sheets_service
+            if jobs > 1 and oauth_creds:
+                drive, sheets = _thread_services(oauth_creds, drive_service, sheets_service)
+            # Concurrent stories print their logs one whole story at a time
+            with _buffered_output() if jobs > 1 else nullcontext():
+                return process_story(
+                    idx, story, len(stories), tmpdir, start_time,
+                    fetch_eng=fetch_eng, fetch_tam=fetch_tam,
+                    drive_service=drive, sheets_service=sheets, oauth_creds=oauth_creds,
+                    prefetched=prefetched, translation_enabled=translation_enabled,
+                )
+
+        if jobs == 1:
+            # Overlap the next stories' downloads with this story's extraction
+            items = list(enumerate(stories, 1))
+            with ThreadPoolExecutor(max_workers=1) as downloader:
+                def prefetch(item):
+                    idx, story = item
+                    return downloader.submit(
+                        prefetch_story_pdfs, idx, story, tmpdir,
+                        fetch_eng=fetch_eng, fetch_tam=fetch_tam,
+                        drive_service=drive_service, oauth_creds=oauth_creds,
                     )
-                else:
-                    eng_desc = "[Download failed]"
-                    print(f"  >> English: {eng_desc}")
-            elif fetch_eng:
-                print("  English PDF: [not available]")
-
-            # Tamil: Always download PDF for title, but translate description from English
-            if fetch_tam and story["pdf_tam"]:
-                pdf_path = os.path.join(tmpdir, f"tam_{idx}.pdf")
-                log(f"    Downloading Tamil PDF...")
-                if download_pdf(story["pdf_tam"], pdf_path, drive_service):
-                    # Always extract Tamil title from PDF
-                    page1 = extract_page1_info(pdf_path, is_tamil=True)
-                    tam_pdf_title = page1["title"]
-                    if not translator and page1["translator"]:
-                        translator = page1["translator"]
-                    print(f"  >> Tamil title (from PDF): {tam_pdf_title}")
-
-                    # For description: prefer translation, fallback to PDF extraction
-                    if eng_desc and eng_desc != "[Download failed]":
-                        log(f"    Translating English description to Tamil...")
-                        tam_desc = translate_to_tamil(eng_desc, oauth_creds=oauth_creds)
-                        if tam_desc:
-                            print(f"  >> Tamil description (translated): {tam_desc[:100]}...")
-                        else:
-                            log(f"    Translation failed, extracting from Tamil PDF...")
-                            tam_desc = extract_description_from_pdf(pdf_path, is_tamil=True)
-                            print(f"  >> Tamil description (from PDF): {tam_desc}")
-                    else:
-                        # No English description, extract from Tamil PDF
-                        tam_desc = extract_description_from_pdf(pdf_path, is_tamil=True)
-                        print(f"  >> Tamil description (from PDF): {tam_desc}")
-                else:
-                    print(f"  >> Tamil PDF: [Download failed]")
-            elif fetch_tam:
-                print("  Tamil PDF: [not available]")
-
-            # Use PDF-extracted values if available, fall back to spreadsheet values
-            results.append({
-                "english_title": eng_pdf_title or story["english_title"],
-                "tamil_title": tam_pdf_title or story["tamil_title"],
-                "pdf_eng": story["pdf_eng"],
-                "pdf_tam": story["pdf_tam"],
-                "image": image_url or story["image"],
-                "sw_link_eng": story["sw_link_eng"],
-                "sw_link_tam": story["sw_link_tam"],
-                "translators": translator or story["translators"],
-                "english_description": eng_desc or story["english_description"],
-                "tamil_description": tam_desc or story["tamil_description"],
-                "status": story["status"],
-                "tags": story["tags"],
-            })
+
+                downloads = [prefetch(item) for item in items[:PREFETCH_STORIES]]
+                results = []
+                for i, item in enumerate(items):
+                    if i + PREFETCH_STORIES < len(items):
+                        downloads.append(prefetch(items[i + PREFETCH_STORIES]))
+                    results.append(run(item, downloads[i]))
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(run, enumerate(stories, 1)))
+
+        # Tamil PDFs stay in tmpdir until their translations are back
+        finish_tamil_descriptions(results, oauth_creds=oauth_creds, jobs=jobs)
+        results = [row for _, row in results]
 
     total_elapsed = time.time() - start_time
     log(f"Total time: {total_elapsed:.0f}s. Done.")
@@ -1303,10 +2142,13 @@ def main():
             "status": "Status",
             "tags": "Tags",
         }
-        with open(args.output, "w", newline="", encoding="utf-8-sig") as f:
+        # Tamil text is 3 bytes a character in UTF-8 and compresses well
+        opener = gzip.open if args.output.endswith(".gz") else open
+        with opener(args.output, "wt", newline="", encoding="utf-8-sig") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
-            # Write custom header row
-            f.write(",".join(header_map[col] for col in fieldnames) + "\n")
+            # Write custom header row (through the writer, so it is quoted
+            # and terminated the same way as the data rows)
+            writer.writerow(header_map)
             writer.writerows(results)
         print(f"\nResults written to {args.output} ({len(results)} rows)")
 
@@ -0,0 +1,66 @@
+"""Tests for add_stories.py.
+
+Run from the repository root with: python -m unittest discover scripts/tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import add_stories  # noqa: E402
+
+
+class StoryContentHashTest(unittest.TestCase):
+    def test_same_fields_give_same_hash(self):
+        self.assertEqual(add_stories._story_content_hash("Red Kite", "cover.jpg"),
+                         add_stories._story_content_hash("Red Kite", "cover.jpg"))
+
+    def test_hash_changes_with_any_field(self):
+        base = add_stories._story_content_hash("Red Kite", "cover.jpg")
+        self.assertNotEqual(base, add_stories._story_content_hash("Red Kite!", "cover.jpg"))
+        self.assertNotEqual(base, add_stories._story_content_hash("Red Kite", "cover.png"))
+
+    def test_field_boundaries_are_kept(self):
+        self.assertNotEqual(add_stories._story_content_hash("ab", "c"),
+                            add_stories._story_content_hash("a", "bc"))
+
+    def test_hash_changes_with_frontmatter_version(self):
+        base = add_stories._story_content_hash("Red Kite")
+        with mock.patch.object(add_stories, "FRONTMATTER_VERSION",
+                               add_stories.FRONTMATTER_VERSION + 1):
+            self.assertNotEqual(base, add_stories._story_content_hash("Red Kite"))
+
+
+class ReadContentHashTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.index_md = Path(tmp.name) / "index.md"
+
+    def test_reads_hash_written_into_front_matter(self):
+        content_hash = add_stories._story_content_hash("Red Kite")
+        self.index_md.write_text(add_stories.create_story_frontmatter(
+            "Red Kite", "சிவப்பு பட்டம்", "A kite.", "ஒரு பட்டம்.",
+            "https://example.com/eng.pdf", "https://example.com/tam.pdf",
+            "Translator", "cover.jpg", content_hash=content_hash, today="2024-01-01",
+        ), encoding="utf-8")
+        self.assertEqual(add_stories._read_content_hash(self.index_md), content_hash)
+
+    def test_front_matter_without_hash(self):
+        self.index_md.write_text(add_stories.create_story_frontmatter(
+            "Red Kite", "சிவப்பு பட்டம்", "A kite.", "ஒரு பட்டம்.",
+            "https://example.com/eng.pdf", "https://example.com/tam.pdf",
+            "Translator", "cover.jpg", today="2024-01-01",
+        ), encoding="utf-8")
+        self.assertIsNone(add_stories._read_content_hash(self.index_md))
+
+    def test_missing_file(self):
+        self.assertIsNone(add_stories._read_content_hash(self.index_md))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Tests for extract_stories.py.
+
+Run from the repository root with: python -m unittest discover scripts/tests
+"""
+
+import json
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import extract_stories  # noqa: E402
+
+
+class CachedByPdfKeyTest(unittest.TestCase):
+    """The "pdf" cache key covers everything an extractor's result depends on."""
+
+    def setUp(self):
+        self.cache = {}
+        self.calls = 0
+        for name, value in {
+            "_file_digest": lambda path: "digest",
+            "_cache_get": lambda table, key: self.cache.get((table, key)),
+            "_cache_put": self.cache_put,
+            "QUIET": True,
+            "OCR_BACKEND": "gemini",
+            "GEMINI_MODEL": "gemini-a",
+            "TESSERACT_OCR_DPI": 200,
+        }.items():
+            patcher = mock.patch.object(extract_stories, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        @extract_stories._cached_by_pdf("Test", lambda result, is_tamil: result != "bad")
+        def extract(doc, pdf_path, is_tamil=False):
+            self.calls += 1
+            return doc
+        self.extract = extract
+
+    def cache_put(self, table, key, text):
+        self.cache[(table, key)] = text
+
+    def key(self, is_tamil=False):
+        """Run the extractor on a fresh cache and return the key it stored."""
+        self.cache.clear()
+        self.extract("result", "story.pdf", is_tamil=is_tamil)
+        (table, key), = self.cache
+        self.assertEqual(table, "pdf")
+        return key
+
+    def test_english_key(self):
+        self.assertEqual(self.key(),
+                         f"digest:extract:eng:v{extract_stories.PDF_CACHE_VERSION}")
+
+    def test_english_key_ignores_ocr_settings(self):
+        english = self.key()
+        with mock.patch.object(extract_stories, "OCR_BACKEND", "tesseract"):
+            self.assertEqual(self.key(), english)
+
+    def test_tamil_gemini_key_includes_model(self):
+        self.assertEqual(self.key(is_tamil=True),
+                         f"digest:extract:tam-gemini-gemini-a:v{extract_stories.PDF_CACHE_VERSION}")
+        first = self.key(is_tamil=True)
+        with mock.patch.object(extract_stories, "GEMINI_MODEL", "gemini-b"):
+            self.assertNotEqual(self.key(is_tamil=True), first)
+
+    def test_tamil_tesseract_key_includes_dpi(self):
+        with mock.patch.object(extract_stories, "OCR_BACKEND", "tesseract"):
+            self.assertEqual(self.key(is_tamil=True),
+                             f"digest:extract:tam-tesseract-200dpi:v{extract_stories.PDF_CACHE_VERSION}")
+            first = self.key(is_tamil=True)
+            with mock.patch.object(extract_stories, "TESSERACT_OCR_DPI", 300):
+                self.assertNotEqual(self.key(is_tamil=True), first)
+
+    def test_cached_result_skips_extraction(self):
+        self.extract("result", "story.pdf")
+        self.assertEqual(self.extract("other", "story.pdf"), "result")
+        self.assertEqual(self.calls, 1)
+
+    def test_uncacheable_result_is_not_stored(self):
+        self.assertEqual(self.extract("bad", "story.pdf"), "bad")
+        self.assertEqual(self.cache, {})
+
+    def test_unreadable_pdf_is_not_cached(self):
+        with mock.patch.object(extract_stories, "_file_digest", side_effect=OSError):
+            self.assertEqual(self.extract("result", "story.pdf"), "result")
+        self.assertEqual(self.cache, {})
+
+    def test_stored_value_is_json(self):
+        self.extract({"title": "Red Kite"}, "story.pdf")
+        (text,) = self.cache.values()
+        self.assertEqual(json.loads(text), {"title": "Red Kite"})
+
+
+class FakeClock:
+    """Stands in for the time module: sleep() advances monotonic()."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class RateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(extract_stories, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_first_call_does_not_wait(self):
+        extract_stories.RateLimiter(2).acquire()
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_calls_are_spaced_by_the_interval(self):
+        limiter = extract_stories.RateLimiter(2)
+        starts = []
+        for _ in range(4):
+            limiter.acquire()
+            starts.append(self.clock.now)
+        self.assertEqual([b - a for a, b in zip(starts, starts[1:])], [0.5, 0.5, 0.5])
+
+    def test_time_spent_elsewhere_counts_towards_the_interval(self):
+        limiter = extract_stories.RateLimiter(2)
+        limiter.acquire()
+        self.clock.now += 0.3
+        limiter.acquire()
+        self.assertAlmostEqual(self.clock.sleeps[-1], 0.2)
+        self.clock.now += 1.0
+        limiter.acquire()
+        self.assertEqual(len(self.clock.sleeps), 1)
+
+
+class RateLimiterThreadsTest(unittest.TestCase):
+    def test_threads_share_the_spacing(self):
+        limiter = extract_stories.RateLimiter(50)
+        threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(3)])
+                   for _ in range(4)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 12 calls from 4 threads still get 12 slots 1/50s apart
+        self.assertGreaterEqual(time.monotonic() - start, 11 / 50)
+
+
+if __name__ == "__main__":
+    unittest.main()